@@ -7,52 +7,151 @@ Supports both Gemini and Claude with automatic provider detection.
 """
 
 import sys
-import subprocess
+import shutil
+import asyncio
+import codecs
+import functools
+from typing import AsyncIterator, Optional, Tuple
+
 import click
 from rich.console import Console
-from rich.panel import Panel
 
-from tui_renderer import render_response
 from ai_provider import detect_provider
 from banner import print_banner_instant
+import tules_cache
 
 console = Console()
 
+# Larger piped prompts would blow past provider context limits anyway
+MAX_STDIN_BYTES = 1024 * 1024
+
+# Bytes read from the provider CLI per chunk while streaming
+READ_CHUNK_SIZE = 64 * 1024
+
 class TulesCommand(click.Command):
     def format_help(self, ctx, formatter):
         console.print(f"[cyan]{print_banner_instant()}[/cyan]")
         super().format_help(ctx, formatter)
 
-def get_ai_response(prompt: str, provider_name: str) -> str:
-    """Get response from AI provider using CLI command."""
+@functools.lru_cache(maxsize=None)
+def resolve_cli(name: str) -> Optional[str]:
+    """Resolve a provider CLI on PATH once per process."""
+    return shutil.which(name)
+
+
+async def stream_ai_response(prompt: str, provider_name: str,
+                             timeout: float = 120) -> AsyncIterator[str]:
+    """Stream response text from AI provider CLI without blocking the event loop."""
+    # Determine which command to run
+    if provider_name not in ('gemini', 'claude'):
+        yield f"[red]Error: Unknown provider '{provider_name}'[/red]"
+        return
+
+    binary = resolve_cli(provider_name)
+    if binary is None:
+        yield f"[red]Error: {provider_name} CLI not found. Please install it first.[/red]"
+        return
+
     try:
-        # Determine which command to run
-        if provider_name == 'gemini':
-            cmd = ['gemini', '-p', prompt]
-        elif provider_name == 'claude':
-            cmd = ['claude', '-p', prompt]
-        else:
-            return f"[red]Error: Unknown provider '{provider_name}'[/red]"
-
-        # Run the CLI command and capture output
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120  # 2 minute timeout
+        process = await asyncio.create_subprocess_exec(
+            binary, '-p', prompt,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
+    except Exception as e:
+        yield f"[red]Error: {str(e)}[/red]"
+        return
 
-        if result.returncode != 0:
-            return f"[red]Error running {provider_name}: {result.stderr}[/red]"
+    # Drain stderr concurrently so a chatty CLI can't fill the pipe and stall
+    stderr_task = asyncio.ensure_future(process.stderr.read())
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
 
-        return result.stdout.strip()
+    # Fixed-size reads: readline() would fail on lines over the 64 KiB stream limit.
+    # The incremental decoder keeps multi-byte characters split across reads intact.
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
 
-    except FileNotFoundError:
-        return f"[red]Error: {provider_name} CLI not found. Please install it first.[/red]"
-    except subprocess.TimeoutExpired:
-        return "[red]Error: Command timed out after 2 minutes[/red]"
-    except Exception as e:
-        return f"[red]Error: {str(e)}[/red]"
+    try:
+        while True:
+            data = await asyncio.wait_for(process.stdout.read(READ_CHUNK_SIZE),
+                                          timeout=max(0, deadline - loop.time()))
+            if not data:
+                break
+            text = decoder.decode(data)
+            if text:
+                yield text
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+        await asyncio.wait_for(process.wait(), timeout=max(0, deadline - loop.time()))
+    except asyncio.TimeoutError:
+        yield f"[red]Error: Command timed out after {int(timeout)} seconds[/red]"
+        return
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        stderr = (await stderr_task).decode('utf-8', errors='replace')
+
+    if process.returncode != 0:
+        yield f"[red]Error running {provider_name}: {stderr}[/red]"
+
+
+async def _instant_async(prompt: str, provider: str, use_cache: bool = True):
+    """Stream the provider's response into the live renderer."""
+    # Deferred: rich.markdown/rich.syntax are the bulk of startup import time
+    from tui_renderer import StreamingMarkdown, render_response
+
+    llm_key = tules_cache.make_llm_key(provider)
+    if use_cache:
+        cached = tules_cache.lookup(prompt, llm_key)
+        if cached is not None:
+            render_response(cached)
+            return
+
+    failed = False
+    with StreamingMarkdown() as stream:
+        async for chunk in stream_ai_response(prompt, provider):
+            failed = failed or chunk.startswith('[red]Error')
+            stream.feed(chunk)
+
+    # Only cache complete, successful responses
+    if use_cache and not failed:
+        tules_cache.update(prompt, llm_key, stream.text.strip())
+
+
+async def collect_ai_response(prompt: str, provider: str,
+                              use_cache: bool = True) -> Tuple[str, str]:
+    """Gather a provider's full response (no live rendering); returns (provider, text)."""
+    llm_key = tules_cache.make_llm_key(provider)
+    if use_cache:
+        cached = tules_cache.lookup(prompt, llm_key)
+        if cached is not None:
+            return provider, cached
+
+    chunks = []
+    failed = False
+    async for chunk in stream_ai_response(prompt, provider):
+        failed = failed or chunk.startswith('[red]Error')
+        chunks.append(chunk)
+    text = ''.join(chunks).strip()
+
+    if use_cache and not failed:
+        tules_cache.update(prompt, llm_key, text)
+    return provider, text
+
+
+async def _compare_async(prompt: str, use_cache: bool = True):
+    """Query both providers concurrently and render the answers side by side."""
+    from tui_renderer import render_comparison
+
+    # Both CLIs run at once, so wall-clock is the slower of the two, not the sum
+    with console.status("[dim]Waiting for gemini and claude...[/dim]"):
+        responses = await asyncio.gather(
+            collect_ai_response(prompt, 'gemini', use_cache),
+            collect_ai_response(prompt, 'claude', use_cache),
+        )
+    render_comparison(list(responses))
 
 
 @click.command(cls=TulesCommand)
@@ -60,7 +159,9 @@ def get_ai_response(prompt: str, provider_name: str) -> str:
 @click.option('--provider', type=click.Choice(['gemini', 'claude', 'auto']), default='auto',
               help='AI provider to use (default: auto-detect)')
 @click.option('--stdin', is_flag=True, help='Read prompt from stdin')
-def instant(prompt: str, provider: str, stdin: bool):
+@click.option('--no-cache', is_flag=True, help='Bypass the local response cache')
+@click.option('--compare', is_flag=True, help='Ask both gemini and claude and show the answers side by side')
+def instant(prompt: str, provider: str, stdin: bool, no_cache: bool, compare: bool):
     """
     Tules-instant - Get instant AI responses with rich formatting
 
@@ -69,12 +170,19 @@ def instant(prompt: str, provider: str, stdin: bool):
         Ti "Explain recursion"
         echo "Write a haiku" | Ti --stdin
         Ti --provider claude "Write a poem"
+        Ti --no-cache "What is 2+2?"
+        Ti --compare "Explain closures"
     """
 
     # Get prompt from stdin if requested
     if stdin:
         if not sys.stdin.isatty():
-            prompt = sys.stdin.read().strip()
+            # One bulk read + decode instead of the line-buffered text wrapper
+            data = sys.stdin.buffer.read(MAX_STDIN_BYTES + 1)
+            if len(data) > MAX_STDIN_BYTES:
+                console.print(f"[red]Error: stdin input exceeds {MAX_STDIN_BYTES // (1024 * 1024)} MB[/red]")
+                sys.exit(1)
+            prompt = data.decode('utf-8', errors='replace').strip()
         else:
             console.print("[red]Error: --stdin flag used but no input on stdin[/red]")
             sys.exit(1)
@@ -86,6 +194,10 @@ def instant(prompt: str, provider: str, stdin: bool):
         console.print("       Ti \"your prompt here\"")
         sys.exit(1)
 
+    if compare:
+        asyncio.run(_compare_async(prompt, use_cache=not no_cache))
+        return
+
     # Auto-detect provider if needed
     if provider == 'auto':
         detected = detect_provider()
@@ -98,11 +210,8 @@ def instant(prompt: str, provider: str, stdin: bool):
     # Show which provider we're using
     console.print(f"[dim]Using {provider}...[/dim]\n")
 
-    # Get response from provider
-    response = get_ai_response(prompt, provider)
-
-    # Render response with rich formatting
-    render_response(response)
+    # Stream response from provider, rendering as it arrives
+    asyncio.run(_instant_async(prompt, provider, use_cache=not no_cache))
 
 
 if __name__ == '__main__':
@@ -7,23 +7,51 @@ Supports both Claude Code and Gemini CLI backends.
 
 import os
 import sys
-import subprocess
+import shutil
+import signal
 import re
+import functools
+import heapq
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
+
+# Terminal control for the interactive browser (unavailable on Windows)
+try:
+    import tty
+    import termios
+    import select
+except ImportError:
+    tty = termios = select = None
 
 import click
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.layout import Layout
+from rich.live import Live
+from rich.text import Text
 
 # Import AI provider abstraction
 from ai_provider import get_provider, detect_provider
 from banner import print_banner_sessions
+from sessions_index import SessionIndex
 
 console = Console()
 
+# Sessions listed per directory unless --all-history is passed
+MAX_LISTED_SESSIONS = 200
+
+# Sort key for newest-first ordering (C-level attribute lookup, no lambda frame)
+_TIMESTAMP = attrgetter('timestamp')
+
+@functools.lru_cache(maxsize=1)
+def _cwd() -> str:
+    """Working directory of this process (never changes; Tules-sessions doesn't chdir)"""
+    return os.getcwd()
+
 class TulesCommand(click.Command):
     def format_help(self, ctx, formatter):
         console.print(f"[cyan]{print_banner_sessions()}[/cyan]")
@@ -31,13 +59,19 @@ class TulesCommand(click.Command):
 
 # Session data class
 class Session:
-    def __init__(self, session_path: Path, provider):
-        """Initialize session from file using provider abstraction"""
+    # Thousands of these can be alive with --all; skip the per-instance __dict__
+    __slots__ = ('path', 'provider', 'id', 'summary', 'cwd', 'git_branch', 'timestamp',
+                 'is_agent', '_cwd_exists', 'message_count', '_messages',
+                 'short_id', 'short_summary', 'summary_lower', 'date_str', '_log_path')
+
+    def __init__(self, session_path: Path, provider, metadata: Optional[Dict] = None):
+        """Initialize session from file (or already-parsed metadata) using provider abstraction"""
         self.path = session_path
         self.provider = provider
 
-        # Parse metadata using provider
-        metadata = provider.parse_session_file(session_path)
+        # Parse listing metadata using provider unless the index already had it
+        if metadata is None:
+            metadata = provider.parse_session_header(session_path)
 
         self.id = metadata['id']
         self.summary = metadata['summary']
@@ -45,102 +79,260 @@ class Session:
         self.git_branch = metadata.get('git_branch')
         self.timestamp = metadata['timestamp']
         self.is_agent = metadata.get('is_agent', False)
-        self.messages = metadata.get('messages', [])
+        self._cwd_exists = None
+        self._log_path = False  # not looked up yet (None means no log file)
+
+        # Display forms used by the table and headers, formatted once
+        self.short_id = (self.id or 'unknown')[:8]
+        self.short_summary = self.summary[:60]
+        self.summary_lower = self.summary.lower()  # haystack for literal searches
+        self.date_str = self.timestamp.strftime("%Y-%m-%d %H:%M")
+
+        # Message bodies are only parsed when the session is opened
+        self.message_count = metadata.get('message_count', 0)
+        self._messages = None
+
+    @property
+    def messages(self) -> List[Dict]:
+        """All conversation messages (parsed from the file on first access)"""
+        if self._messages is None:
+            # Flatten each message's parts once, not on every detail redraw
+            self._messages = [normalize_message(msg)
+                              for msg in self.provider.parse_session_messages(self.path)]
+        return self._messages
 
     def get_full_conversation(self) -> List[Dict]:
         """Get full conversation messages"""
         return self.messages
 
+    @property
+    def cwd_exists(self) -> bool:
+        """Whether the session's working directory still exists (checked once)"""
+        if self._cwd_exists is None:
+            self._cwd_exists = bool(self.cwd) and os.path.isdir(self.cwd)
+        return self._cwd_exists
+
     def get_log_path(self) -> Optional[Path]:
-        """Get log file path for background agent sessions"""
-        if not self.id:
-            return None
+        """Get log file path for background agent sessions (looked up once)
+
+        Like the rest of the session metadata, this is a snapshot taken when
+        the session list was loaded.
+        """
+        if self._log_path is False:
+            self._log_path = None
+            if self.id:
+                # Log file is {provider bg-agents dir}/logs/{session_id}.log
+                log_file = self.provider.get_bg_agents_dir() / 'logs' / f'{self.id}.log'
+                if os.path.isfile(log_file):
+                    self._log_path = log_file
+        return self._log_path
+
+    def __repr__(self):
+        return f"Session({self.short_id}, {self.short_summary[:30]})"
+
+def _safe_parse_header(provider, session_file: Path,
+                       st: os.stat_result) -> Tuple[Optional[Dict], Optional[Exception]]:
+    """Parse a session header, returning (metadata, None) or (None, error)"""
+    try:
+        return provider.parse_session_header(session_file, mtime=st.st_mtime), None
+    except Exception as e:
+        return None, e
+
+def load_sessions(session_entries: List[Tuple[Path, os.stat_result]], provider, index: SessionIndex,
+                  top_k: Optional[int] = None, since: Optional[datetime] = None) -> List[Session]:
+    """Build Sessions for (path, stat) entries, reusing the index where files are unchanged
+
+    When top_k is given, only the top_k most recent sessions are returned.
+    With `since`, files last modified before it are skipped without being
+    parsed (filter_sessions still applies the exact check).
+    JSON decoding dominates a cold run; providers read session files as bytes
+    and use orjson when it is installed.
+    """
+    # A session can't have started after its file was last written, so mtime is a
+    # safe lower-bound prefilter for --since (not for --before: Gemini sessions
+    # are dated by start time)
+    if since is not None:
+        since_ts = since.timestamp()
+        session_entries = [(f, st) for f, st in session_entries if st.st_mtime >= since_ts]
+
+    if not session_entries:
+        return []
 
-        # Get provider's bg-agents directory
-        bg_agents_dir = self.provider.get_bg_agents_dir()
-        logs_dir = bg_agents_dir / 'logs'
+    # Reuse indexed metadata; only files that changed need a fresh parse
+    sessions = []
+    stale = []
+    for session_file, st in session_entries:
+        metadata = index.lookup(session_file, st)
+        if metadata is None:
+            stale.append((session_file, st))
+        else:
+            sessions.append(Session(session_file, provider, metadata))
 
-        # Log file is named {session_id}.log
-        log_file = logs_dir / f'{self.id}.log'
+    if stale:
+        if len(stale) == 1:
+            # Typical warm run: one session changed, not worth spinning up threads
+            results = [_safe_parse_header(provider, *stale[0])]
+        else:
+            # Parsing is I/O-bound, so a thread pool overlaps the file reads
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(stale))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(functools.partial(_safe_parse_header, provider),
+                                            *zip(*stale)))
+
+        for (session_file, st), (metadata, error) in zip(stale, results):
+            if metadata is None:
+                # Skip files that can't be parsed
+                console.print(f"[dim]Warning: Could not parse {session_file.name}: {error}[/dim]")
+                continue
+            index.store(session_file, st, metadata)
+            sessions.append(Session(session_file, provider, metadata))
+
+    # Sort by timestamp (newest first) - a bounded heap when only top_k are needed
+    if top_k is not None and top_k < len(sessions):
+        return heapq.nlargest(top_k, sessions, key=_TIMESTAMP)
+    return sorted(sessions, key=_TIMESTAMP, reverse=True)
+
+def find_sessions_for_directory(directory: Path, provider, top_k: Optional[int] = None,
+                                since: Optional[datetime] = None) -> List[Session]:
+    """Find sessions for a specific (already absolute) directory using provider abstraction"""
+    # Get session files (with their stat results, from one scandir pass) using provider
+    session_entries = provider.find_session_entries(directory)
+    if not session_entries:
+        return []
 
-        return log_file if log_file.exists() else None
+    with SessionIndex() as index:
+        return load_sessions(session_entries, provider, index, top_k, since)
 
-    def __repr__(self):
-        return f"Session({self.id[:8] if self.id else 'unknown'}, {self.summary[:30]})"
+def find_all_sessions(provider, top_k: Optional[int] = None,
+                      since: Optional[datetime] = None) -> Dict[str, List[Session]]:
+    """Find all sessions grouped by directory (most recently active first)
 
-def find_sessions_for_directory(directory: str, provider) -> List[Session]:
-    """Find all sessions for a specific directory using provider abstraction"""
-    directory = os.path.abspath(directory)
+    Every project directory the provider knows about is scanned; the shared
+    index means only new or changed files are parsed.
+    """
+    groups: Dict[str, List[Session]] = {}
+    merged = set()
+    with SessionIndex() as index:
+        for sessions_dir in provider.find_all_sessions_dirs():
+            sessions = load_sessions(provider.list_session_entries(sessions_dir),
+                                     provider, index, top_k, since)
+            if not sessions:
+                continue
+            # Storage names are encoded/hashed; key by the full recorded working directory
+            key = next((s.cwd for s in sessions if s.cwd), str(sessions_dir))
+            if key in groups:
+                # Several storage directories can record the same cwd; merge, don't overwrite
+                groups[key].extend(sessions)
+                merged.add(key)
+            else:
+                groups[key] = sessions
+
+    for key in merged:
+        sessions = groups[key]
+        if top_k is not None and top_k < len(sessions):
+            groups[key] = heapq.nlargest(top_k, sessions, key=_TIMESTAMP)
+        else:
+            sessions.sort(key=_TIMESTAMP, reverse=True)
 
-    # Get session files using provider
-    session_files = provider.find_session_files(directory)
+    return dict(sorted(groups.items(), key=lambda group: group[1][0].timestamp, reverse=True))
 
-    if not session_files:
-        return []
+def parse_date_bound(value: str) -> datetime:
+    """Parse a --since/--before date as naive local time, matching session timestamps"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
 
-    sessions = []
-    for session_file in session_files:
-        try:
-            session = Session(session_file, provider)
-            sessions.append(session)
-        except Exception as e:
-            # Skip files that can't be parsed
-            console.print(f"[dim]Warning: Could not parse {session_file.name}: {e}[/dim]")
-            continue
-
-    # Sort by timestamp (newest first)
-    return sorted(sessions, key=lambda s: s.timestamp, reverse=True)
-
-def find_all_sessions(provider) -> Dict[str, List[Session]]:
-    """Find all sessions grouped by directory"""
-    # For now, this is complex to implement generically
-    # We would need to scan all possible project directories
-    # Let's simplify and just return sessions for current dir
-    # Users can use --all with a specific provider
-    console.print("[yellow]Note: --all flag with multi-provider is not yet fully supported[/yellow]")
-    console.print("[yellow]Showing sessions for current directory only[/yellow]")
-
-    cwd = os.getcwd()
-    sessions = find_sessions_for_directory(cwd, provider)
-
-    if sessions:
-        return {cwd: sessions}
-    return {}
+@functools.lru_cache(maxsize=32)
+def _compile_search(pattern: str) -> 're.Pattern':
+    """Compile a search regex once, reused across redraws and --all directory groups"""
+    return re.compile(pattern, re.IGNORECASE)
+
+# Characters that make a search pattern more than a plain substring
+_REGEX_META = frozenset('.^$*+?{}[]\\|()')
+
+def _search_literal(pattern: 're.Pattern') -> Optional[str]:
+    """Lowercased search text if the pattern is a plain substring, else None"""
+    if _REGEX_META.isdisjoint(pattern.pattern):
+        return pattern.pattern.lower()
+    return None
 
 def filter_sessions(sessions: List[Session],
                    since: Optional[str] = None,
                    before: Optional[str] = None,
-                   search: Optional[str] = None,
+                   search: Union[str, 're.Pattern', None] = None,
                    agents_only: bool = False,
                    main_only: bool = False) -> List[Session]:
-    """Filter sessions based on criteria"""
-
-    filtered = sessions
+    """Filter sessions based on criteria
 
-    # Date filters
-    if since:
-        since_date = datetime.fromisoformat(since)
-        filtered = [s for s in filtered if s.timestamp >= since_date]
+    `search` may be a regex string or a pattern already compiled by the caller.
+    """
 
-    if before:
-        before_date = datetime.fromisoformat(before)
-        filtered = [s for s in filtered if s.timestamp <= before_date]
+    # Nothing to filter - avoid copying the list
+    if not (since or before or search or agents_only or main_only):
+        return sessions
+
+    # Resolve every criterion once, outside the per-session loop
+    since_date = parse_date_bound(since) if since else None
+    before_date = parse_date_bound(before) if before else None
+    pattern = _compile_search(search) if isinstance(search, str) else search
+    # Plain-text searches skip the regex engine entirely
+    literal = _search_literal(pattern) if pattern is not None else None
+
+    def keep(s: Session) -> bool:
+        # Date filters
+        if since_date is not None and s.timestamp < since_date:
+            return False
+        if before_date is not None and s.timestamp > before_date:
+            return False
+
+        # Search filter
+        if literal is not None:
+            if literal not in s.summary_lower:
+                return False
+        elif pattern is not None and not pattern.search(s.summary):
+            return False
+
+        # Type filters
+        if agents_only:
+            return s.is_agent
+        if main_only:
+            return not s.is_agent
+        return True
+
+    return [s for s in sessions if keep(s)]
+
+def build_session_rows(sessions: List[Session]) -> List[Tuple[str, str, str, str]]:
+    """Format the static cells (ID, type, summary, date) for each session"""
+    return [
+        (
+            session.short_id,
+            "[magenta]AGENT[/magenta]" if session.is_agent else "[blue]MAIN[/blue]",
+            session.short_summary,
+            session.date_str,
+        )
+        for session in sessions
+    ]
 
-    # Search filter
-    if search:
-        pattern = re.compile(search, re.IGNORECASE)
-        filtered = [s for s in filtered if pattern.search(s.summary)]
+def create_session_table(sessions: List[Session], directory: str, selected_idx: int = -1,
+                         rows: Optional[List[Tuple[str, str, str, str]]] = None,
+                         window: Optional[int] = None) -> Table:
+    """Create a Rich table for session list
 
-    # Type filters
-    if agents_only:
-        filtered = [s for s in filtered if s.is_agent]
-    elif main_only:
-        filtered = [s for s in filtered if not s.is_agent]
+    Pass pre-built `rows` (from build_session_rows) to skip re-formatting
+    cells when only the selection changes between redraws. With `window`,
+    only that many lines of rows around the selection are rendered.
+    """
+    if rows is None:
+        rows = build_session_rows(sessions)
 
-    return filtered
+    start, end = 0, len(rows)
+    if window is not None and len(rows) > window:
+        # Keep the selection centred; two lines go to the "more" markers
+        visible = max(1, window - 2)
+        start = max(0, min(selected_idx - visible // 2, len(rows) - visible))
+        end = start + visible
 
-def create_session_table(sessions: List[Session], directory: str, selected_idx: int = -1) -> Table:
-    """Create a Rich table for session list"""
     table = Table(title=f"📁 Sessions for {directory}", title_style="bold cyan")
     table.add_column("", width=2)  # Selection indicator
     table.add_column("ID", style="cyan", width=10)
@@ -148,25 +340,128 @@ def create_session_table(sessions: List[Session], directory: str, selected_idx:
     table.add_column("Summary", style="white")
     table.add_column("Date", style="yellow", width=16)
 
-    for i, session in enumerate(sessions):
-        prefix = ">" if i == selected_idx else " "
-        style = "bold green" if i == selected_idx else ""
+    if start > 0:
+        table.add_row("", "", "", f"[dim]… {start} more above[/dim]", "")
 
-        session_type = "[magenta]AGENT[/magenta]" if session.is_agent else "[blue]MAIN[/blue]"
+    for i in range(start, end):
+        if i == selected_idx:
+            table.add_row(">", *rows[i], style="bold green")
+        else:
+            table.add_row(" ", *rows[i])
 
-        table.add_row(
-            prefix,
-            session.id[:8],
-            session_type,
-            session.summary[:60],
-            session.timestamp.strftime("%Y-%m-%d %H:%M"),
-            style=style
-        )
+    if end < len(rows):
+        table.add_row("", "", "", f"[dim]… {len(rows) - end} more below[/dim]", "")
 
     return table
 
+def format_content_part(part) -> str:
+    """Format one part of a Claude message content list"""
+    if isinstance(part, str):
+        return part
+
+    part_type = part.get('type')
+    if part_type == 'text':
+        return part.get('text', '')
+    if part_type == 'tool_use':
+        return f"[dim][Tool use: {part.get('name', 'unknown')}][/dim]"
+    if part_type == 'tool_result':
+        tool_content = part.get('content', '')
+        if isinstance(tool_content, str):
+            preview = tool_content[:200] + '...' if len(tool_content) > 200 else tool_content
+            return f"[dim][Tool result: {preview}][/dim]"
+        return "[dim][Tool result][/dim]"
+    if part_type == 'image':
+        return "[dim][Image attachment][/dim]"
+    return f"[dim][{part_type}][/dim]"
+
+# Shared display labels for the common roles, so every message reuses one string
+_ROLE_LABELS = {'user': 'USER', 'assistant': 'ASSISTANT', 'model': 'MODEL', 'gemini': 'GEMINI'}
+
+def normalize_message(msg: Dict) -> Dict:
+    """Attach the display role (`_role`) and flattened body (`_text`) to a message
+
+    Handles both Claude and Gemini message formats:
+    Claude: {type: "user", message: {role: "user", content: [...]}}
+    Gemini: {type: "user", content: "..."}
+    """
+    if 'message' in msg:
+        role = msg['message'].get('role', 'unknown')
+        content = msg['message'].get('content', [])
+    else:
+        role = msg.get('type', 'unknown')
+        content = msg.get('content', '')
+
+    # Single pass over the parts: string content (Gemini) or a list of parts (Claude)
+    if isinstance(content, str):
+        text = content
+    elif isinstance(content, list):
+        text = '\n'.join(format_content_part(part) for part in content
+                         if isinstance(part, (dict, str)))
+    else:
+        text = ''
+
+    msg['_role'] = _ROLE_LABELS.get(role) or role.upper()
+    msg['_text'] = text
+    return msg
+
+def format_message(idx: int, msg: Dict, lines: List[str], max_chars: int = 1000):
+    """Append a single conversation message's detail-view lines to `lines`
+
+    Appending in place avoids building a per-message string only to split it again.
+    """
+    if '_text' not in msg:
+        normalize_message(msg)
+    text = msg['_text']
+
+    lines.append(f"[bold cyan]Message {idx + 1} - {msg['_role']}:[/bold cyan]")
+
+    if not text:
+        # Even if no text parts, show that a message exists
+        lines.append("[dim](empty or non-text content)[/dim]")
+    else:
+        # Short messages (the common case) are used as-is, without a slice copy
+        length = len(text)
+        if length > max_chars:
+            lines.extend(text[:max_chars].split('\n'))
+            lines.append(f"[dim]... (truncated, {length} chars total)[/dim]")
+        else:
+            lines.extend(text.split('\n'))
+
+    lines.append('')
+
+def create_session_detail(session: Session) -> List[str]:
+    """Build the detail view (metadata plus every message) for a session as lines
+
+    Kept as a list so pagination can slice the visible window without first
+    joining and re-splitting one large string.
+    """
+    # The header parse already counted messages; an empty session needs no reparse
+    messages = session.get_full_conversation() if session.message_count else []
+
+    lines = [
+        f"[bold]Session ID:[/bold] {session.id}",
+        f"[bold]Type:[/bold] {'Agent' if session.is_agent else 'Main Session'}",
+        f"[bold]Summary:[/bold] {session.summary}",
+        f"[bold]Working Directory:[/bold] {session.cwd or 'Unknown'}",
+        f"[bold]Git Branch:[/bold] {session.git_branch or 'Unknown'}",
+        f"[bold]Last Modified:[/bold] {session.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"[bold]Total Messages:[/bold] {len(messages)}",
+        "",
+        '─' * 80,
+        "[bold]Full Conversation:[/bold]",
+        "",
+    ]
+
+    if not messages:
+        lines.append("[dim](no messages)[/dim]")
+
+    for idx, msg in enumerate(messages):
+        format_message(idx, msg, lines)
+
+    return lines
+
 def resume_session(session: Session, fork: bool = False):
-    """Resume a session in the current terminal"""
+    """Resume a session in the current terminal (replaces this process)"""
     # Get resume command from provider
     args = session.provider.get_resume_command(session.id, fork)
 
@@ -175,25 +470,90 @@ def resume_session(session: Session, fork: bool = False):
         return
 
     # Change to original working directory if available
-    cwd = session.cwd if session.cwd and os.path.exists(session.cwd) else os.getcwd()
+    cwd = session.cwd if session.cwd_exists else _cwd()
+
+    console.print(f"\n[green]{'Forking' if fork else 'Resuming'} session {session.short_id}...[/green]\n")
+
+    # Nothing runs after the resumed CLI exits, so hand the process over to it
+    # instead of forking a child and keeping this interpreter alive
+    sys.stdout.flush()
+    os.chdir(cwd)
+    os.execvp(args[0], args)
+
+class LogView:
+    """Line-indexed, seekable view of a log file for paginate_content
+
+    The file is scanned once to record where each line starts; scrolling then
+    reads only the visible lines. The index is rebuilt when the file's
+    mtime/size change (e.g. a running agent appends output).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._offsets: List[int] = []
+        self._size = 0
+        self._stat_key = None
+
+    def refresh(self):
+        """Re-index the file if it changed since the last call"""
+        st = os.stat(self.path)
+        stat_key = (st.st_mtime, st.st_size)
+        if stat_key == self._stat_key:
+            return
 
-    console.print(f"\n[green]{'Forking' if fork else 'Resuming'} session {session.id[:8] if session.id else 'unknown'}...[/green]\n")
-    subprocess.run(args, cwd=cwd)
+        offsets = [0]
+        pos = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                pos += len(line)
+                if line.endswith(b'\n'):
+                    offsets.append(pos)
+        self._offsets = offsets
+        self._size = pos
+        self._stat_key = stat_key
+
+    @property
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def __len__(self) -> int:
+        # Same count as content.split('\n'): a trailing newline adds an empty last line
+        return len(self._offsets)
+
+    def __getitem__(self, index: slice) -> List[str]:
+        start, stop, _ = index.indices(len(self._offsets))
+        if start >= stop:
+            return []
+        end = self._offsets[stop] if stop < len(self._offsets) else self._size
+        with open(self.path, 'rb') as f:
+            f.seek(self._offsets[start])
+            data = f.read(end - self._offsets[start])
+        lines = data.decode('utf-8', errors='replace').split('\n')
+        # The last visible line includes its newline unless it ends the file
+        return [line.rstrip('\r') for line in lines[:stop - start]]
+
+# Cached terminal height; cleared by the SIGWINCH handler when the window is resized
+_term_height: Optional[int] = None
+
+def _on_winch(signum, frame):
+    global _term_height
+    _term_height = None
 
 def get_terminal_height() -> int:
-    """Get terminal height in lines"""
-    try:
-        import shutil
-        return shutil.get_terminal_size().lines
-    except:
-        return 40  # Default fallback
+    """Get terminal height in lines (queried once per resize)"""
+    global _term_height
+    if _term_height is None:
+        try:
+            _term_height = shutil.get_terminal_size().lines
+        except:
+            return 40  # Default fallback
+    return _term_height
 
-def paginate_content(content: str, scroll_offset: int, page_height: int) -> Tuple[str, int, int]:
+def paginate_content(lines: Union[List[str], LogView], scroll_offset: int, page_height: int) -> Tuple[List[str], int, int]:
     """
-    Paginate content for scrolling.
-    Returns: (visible_content, total_lines, max_scroll_offset)
+    Paginate pre-split lines (a list or a LogView) for scrolling.
+    Returns: (visible_lines, total_lines, clamped_scroll_offset)
     """
-    lines = content.split('\n')
     total_lines = len(lines)
 
     # Calculate max scroll offset (can't scroll past the end)
@@ -203,10 +563,18 @@ def paginate_content(content: str, scroll_offset: int, page_height: int) -> Tupl
     scroll_offset = max(0, min(scroll_offset, max_offset))
 
     # Get visible lines
-    visible_lines = lines[scroll_offset:scroll_offset + page_height]
-    visible_content = '\n'.join(visible_lines)
+    return lines[scroll_offset:scroll_offset + page_height], total_lines, scroll_offset
+
+# How long to wait for the rest of an escape sequence before treating Esc as a key
+ESCAPE_TIMEOUT = 0.05
 
-    return visible_content, total_lines, scroll_offset
+# Escape sequences for the special keys the browser understands
+KEY_SEQUENCES = {
+    b'\x1b[A': 'up',
+    b'\x1b[B': 'down',
+    b'\x1b[5~': 'pgup',
+    b'\x1b[6~': 'pgdn',
+}
 
 def interactive_session_browser(sessions: List[Session], directory: str):
     """Interactive TUI for browsing sessions"""
@@ -215,7 +583,6 @@ def interactive_session_browser(sessions: List[Session], directory: str):
         return
 
     # Check if stdin is a TTY (required for interactive mode)
-    import sys
     if not sys.stdin.isatty():
         console.print("[yellow]Interactive mode requires a TTY (terminal)[/yellow]")
         console.print("[yellow]Use --list for non-interactive mode, or run directly in a terminal[/yellow]")
@@ -224,254 +591,313 @@ def interactive_session_browser(sessions: List[Session], directory: str):
         console.print(table)
         return
 
+    if termios is None:
+        # Fallback: non-interactive mode
+        console.print("[yellow]Interactive mode not available (termios not found)[/yellow]")
+        console.print("[yellow]Use --list to view sessions non-interactively[/yellow]")
+        return
+
     selected_idx = 0
     view_mode = 'list'  # 'list', 'detail', or 'logs'
     scroll_offset = 0  # For detail and log views
 
-    console.print("\n[bold cyan]Claude Code Session Browser[/bold cyan]")
-    console.print("[dim]↑/↓: Navigate Sessions | Enter/v: View Details | l: View Logs | r: Resume | f: Fork | q: Quit[/dim]\n")
+    fd = sys.stdin.fileno()
+    pending = b''
+
+    def read_key():
+        """Read a single keypress (an escape sequence arrives in one read)"""
+        nonlocal pending
+        if not pending:
+            pending = os.read(fd, 64)
+        # A burst of keys can split a sequence across reads - fetch the rest,
+        # but don't block on a lone Esc (or other prefix) that has no tail coming
+        while len(pending) < 4 and any(
+                seq.startswith(pending) and seq != pending for seq in KEY_SEQUENCES):
+            if not select.select([fd], [], [], ESCAPE_TIMEOUT)[0]:
+                break
+            pending += os.read(fd, 64)
+        for seq, name in KEY_SEQUENCES.items():
+            if pending.startswith(seq):
+                pending = pending[len(seq):]
+                return name
+        # Plain key (or an escape we don't handle)
+        ch, pending = pending[:1], pending[1:]
+        return ch.decode('latin-1')
+
+    def get_key() -> Tuple[str, int]:
+        """Get the next key and how many times it repeats back to back
+
+        Holding an arrow key queues many identical sequences; they are
+        coalesced into one move so the screen is redrawn once, not per repeat.
+        """
+        nonlocal pending
+        key = read_key()
+        count = 1
+        if key in ('up', 'down', 'pgup', 'pgdn'):
+            seq = next(seq for seq, name in KEY_SEQUENCES.items() if name == key)
+            while True:
+                if not pending and select.select([fd], [], [], 0)[0]:
+                    pending = os.read(fd, 64)
+                if not pending.startswith(seq):
+                    break
+                pending = pending[len(seq):]
+                count += 1
+        return key, count
+
+    # Persistent layout: each keypress only updates regions, Live redraws the diff
+    layout = Layout()
+    layout.split_column(
+        Layout(name="header", size=2),
+        Layout(name="body"),
+        Layout(name="footer", size=1),
+    )
+    resume_target = None  # (session, fork) to resume once the screen is released
+
+    # Session cells never change while browsing; format them once
+    rows = build_session_rows(sessions)
+    cached_table_key = None  # (selected_idx, term_height) of the table in the body
+    log_views: Dict[Path, LogView] = {}  # per log file, kept while browsing
+    detail_cache: Dict[int, List[str]] = {}  # detail view lines per session index
+
+    def render_list(term_height: int, page_height: int):
+        """Session table view"""
+        nonlocal scroll_offset, cached_table_key
+        layout["header"].update(Text.from_markup(
+            "[bold cyan]Claude Code Session Browser[/bold cyan]\n"
+            "[dim]↑/↓: Navigate | Enter/v: Details | l: Logs | r: Resume | f: Fork | q: Quit[/dim]"
+        ))
+
+        # Only render the rows that fit (table title, header and borders take 5 lines).
+        # Keys that don't move the selection (or resize) reuse the last table.
+        table_key = (selected_idx, term_height)
+        if table_key != cached_table_key:
+            layout["body"].update(create_session_table(
+                sessions, directory, selected_idx, rows,
+                window=max(3, term_height - 8)))
+            cached_table_key = table_key
+        layout["footer"].update(Text.from_markup(f"[dim]Session {selected_idx + 1} of {len(sessions)}[/dim]"))
+        scroll_offset = 0  # Reset scroll when returning to list
+
+    def render_detail(term_height: int, page_height: int):
+        """Scrollable metadata + conversation view for the selected session"""
+        nonlocal scroll_offset, cached_table_key
+        cached_table_key = None  # body no longer holds the table
+        session = sessions[selected_idx]
+
+        if page_height <= 0:
+            # No room for content (tiny split pane) - don't build the detail at all
+            layout["header"].update(Text.from_markup(f"[bold cyan]Session Details: {session.short_id}[/bold cyan]"))
+            layout["body"].update(Text.from_markup("[dim]Terminal too small to show details[/dim]"))
+            layout["footer"].update(Text(""))
+            return
+
+        # Build the detail lines once per session; scrolling only re-slices them
+        detail_lines = detail_cache.get(selected_idx)
+        if detail_lines is None:
+            detail_lines = detail_cache[selected_idx] = create_session_detail(session)
 
-    try:
-        import tty
-        import termios
+        # Paginate content; only the visible slice is joined and markup-parsed
+        visible_lines, total_lines, scroll_offset = paginate_content(
+            detail_lines, scroll_offset, page_height
+        )
 
-        def get_key():
-            """Get a single keypress"""
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
+        # Show header with scroll position
+        layout["header"].update(Text.from_markup(
+            f"[bold cyan]Session Details: {session.short_id} ({session.message_count} messages)[/bold cyan]\n"
+            f"[dim]↑/↓: Scroll (PgUp/PgDn: Fast) | n/p: Next/Prev Session | b: Back | l: Logs | r: Resume | q: Quit[/dim]"
+        ))
+        layout["footer"].update(Text.from_markup(
+            f"[dim]Lines {scroll_offset + 1}-{min(scroll_offset + page_height, total_lines)} of {total_lines}[/dim]"
+        ))
+
+        # Show paginated content
+        layout["body"].update(Panel(
+            '\n'.join(visible_lines),
+            border_style="cyan"
+        ))
+
+    def render_logs(term_height: int, page_height: int):
+        """Scrollable log file view for the selected session"""
+        nonlocal scroll_offset, cached_table_key
+        cached_table_key = None
+        session = sessions[selected_idx]
+        log_path = session.get_log_path()
+
+        if not log_path:
+            log_content = ["[yellow]No log file found for this session.[/yellow]", "",
+                           "[dim]Note: Only background agent sessions have log files.[/dim]"]
+        else:
             try:
-                tty.setraw(sys.stdin.fileno())
-                ch = sys.stdin.read(1)
-                # Handle arrow keys and special keys (escape sequences)
-                if ch == '\x1b':
-                    ch2 = sys.stdin.read(1)
-                    if ch2 == '[':
-                        ch3 = sys.stdin.read(1)
-                        if ch3 == 'A':
-                            return 'up'
-                        elif ch3 == 'B':
-                            return 'down'
-                        elif ch3 == '5':  # Page Up
-                            sys.stdin.read(1)  # consume the '~'
-                            return 'pgup'
-                        elif ch3 == '6':  # Page Down
-                            sys.stdin.read(1)  # consume the '~'
-                            return 'pgdn'
-                    # If escape but not arrow key, treat as escape
-                    return ch
-                return ch
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-
-        while True:
-            # Get terminal height for pagination (reserve space for header/footer)
-            term_height = get_terminal_height()
-            page_height = term_height - 8  # Reserve lines for header, footer, padding
-
-            # Clear screen and show content
-            if view_mode == 'list':
-                console.clear()
-                console.print("\n[bold cyan]Claude Code Session Browser[/bold cyan]")
-                console.print("[dim]↑/↓: Navigate | Enter/v: Details | l: Logs | r: Resume | f: Fork | q: Quit[/dim]\n")
-                table = create_session_table(sessions, directory, selected_idx)
-                console.print(table)
-                scroll_offset = 0  # Reset scroll when returning to list
-
-            elif view_mode == 'detail':
-                console.clear()
-
-                # Generate full detail content
-                session = sessions[selected_idx]
-                messages = session.get_full_conversation()
-
-                # Build conversation text - show ALL messages with more content
-                conversation = []
-                for idx, msg in enumerate(messages):
-                    # Handle both Claude and Gemini message formats
-                    # Claude: {type: "user", message: {role: "user", content: [...]}}
-                    # Gemini: {type: "user", content: "..."}
-
-                    if 'message' in msg:
-                        # Claude format - nested message object
-                        role = msg.get('message', {}).get('role', 'unknown')
-                        content = msg.get('message', {}).get('content', [])
-                    else:
-                        # Gemini format - flat structure
-                        role = msg.get('type', 'unknown')
-                        content = msg.get('content', '')
-
-                    # Extract and format content based on type
-                    text_parts = []
-
-                    # Handle string content (Gemini) vs list content (Claude)
-                    if isinstance(content, str):
-                        # Gemini format - content is a plain string
-                        text_parts.append(content)
-                    elif isinstance(content, list):
-                        # Claude format - content is a list of parts
-                        for part in content:
-                            if isinstance(part, dict):
-                                part_type = part.get('type')
-
-                                if part_type == 'text':
-                                    # Regular text content
-                                    text_parts.append(part.get('text', ''))
-                                elif part_type == 'tool_use':
-                                    # Tool usage (function calls)
-                                    tool_name = part.get('name', 'unknown')
-                                    text_parts.append(f"[dim][Tool use: {tool_name}][/dim]")
-                                elif part_type == 'tool_result':
-                                    # Tool results
-                                    tool_content = part.get('content', '')
-                                    if isinstance(tool_content, str):
-                                        preview = tool_content[:200] + '...' if len(tool_content) > 200 else tool_content
-                                        text_parts.append(f"[dim][Tool result: {preview}][/dim]")
-                                    else:
-                                        text_parts.append(f"[dim][Tool result][/dim]")
-                                elif part_type == 'image':
-                                    # Image content
-                                    text_parts.append(f"[dim][Image attachment][/dim]")
-                                else:
-                                    # Other content types
-                                    text_parts.append(f"[dim][{part_type}][/dim]")
-                            elif isinstance(part, str):
-                                # Handle string parts in list
-                                text_parts.append(part)
-
-                    if text_parts:
-                        text = '\n'.join(text_parts)
-                        # Show first 1000 chars instead of 200
-                        truncated = text[:1000]
-                        if len(text) > 1000:
-                            truncated += f"\n[dim]... (truncated, {len(text)} chars total)[/dim]"
-                        conversation.append(f"[bold cyan]Message {idx + 1} - {role.upper()}:[/bold cyan]\n{truncated}\n")
-                    else:
-                        # Even if no text parts, show that a message exists
-                        conversation.append(f"[bold cyan]Message {idx + 1} - {role.upper()}:[/bold cyan]\n[dim](empty or non-text content)[/dim]\n")
-
-                detail_text = f"""[bold]Session ID:[/bold] {session.id}
-[bold]Type:[/bold] {'Agent' if session.is_agent else 'Main Session'}
-[bold]Summary:[/bold] {session.summary}
-[bold]Working Directory:[/bold] {session.cwd or 'Unknown'}
-[bold]Git Branch:[/bold] {session.git_branch or 'Unknown'}
-[bold]Last Modified:[/bold] {session.timestamp.strftime("%Y-%m-%d %H:%M:%S")}
-[bold]Total Messages:[/bold] {len(messages)}
-
-{'─' * 80}
-[bold]Full Conversation:[/bold]
-
-{chr(10).join(conversation)}"""
-
-                # Paginate content
-                visible_content, total_lines, scroll_offset = paginate_content(
-                    detail_text, scroll_offset, page_height
-                )
-
-                # Show header with scroll position
-                console.print(f"\n[bold cyan]Session Details: {session.id[:8]} ({len(messages)} messages)[/bold cyan]")
-                console.print(f"[dim]↑/↓: Scroll (PgUp/PgDn: Fast) | n/p: Next/Prev Session | b: Back | l: Logs | r: Resume | q: Quit[/dim]")
-                console.print(f"[dim]Lines {scroll_offset + 1}-{min(scroll_offset + page_height, total_lines)} of {total_lines}[/dim]\n")
-
-                # Show paginated content
-                console.print(Panel(
-                    visible_content,
-                    border_style="cyan"
-                ))
-
-            elif view_mode == 'logs':
-                console.clear()
-
-                session = sessions[selected_idx]
-                log_path = session.get_log_path()
-
-                if not log_path:
-                    log_content = "[yellow]No log file found for this session.[/yellow]\n\n[dim]Note: Only background agent sessions have log files.[/dim]"
-                    total_lines = 3
-                else:
-                    try:
-                        # Read entire log file for scrolling
-                        with open(log_path, 'r') as f:
-                            log_content = f.read()
-                        if not log_content:
-                            log_content = "[dim]Log file is empty[/dim]"
-                    except Exception as e:
-                        log_content = f"[red]Error reading log file:[/red]\n{str(e)}"
-
-                # Paginate log content
-                visible_content, total_lines, scroll_offset = paginate_content(
-                    log_content, scroll_offset, page_height
-                )
-
-                # Show header with scroll position
-                console.print(f"\n[bold cyan]Logs: {session.id[:8] if session.id else 'unknown'}[/bold cyan]")
-                console.print(f"[dim]↑/↓: Scroll (PgUp/PgDn: Fast) | n/p: Next/Prev Session | b: Back | q: Quit[/dim]")
-                console.print(f"[dim]Lines {scroll_offset + 1}-{min(scroll_offset + page_height, total_lines)} of {total_lines}[/dim]\n")
-
-                # Show paginated content
-                console.print(Panel(
-                    visible_content,
-                    border_style="green"
-                ))
-
-            # Get input
-            key = get_key()
-
-            if key == 'q':
-                break
-            elif key == 'up':
-                if view_mode == 'list':
-                    # Navigate sessions in list view
-                    selected_idx = max(0, selected_idx - 1)
-                else:
-                    # Scroll up in detail/logs view (1 line)
-                    scroll_offset = max(0, scroll_offset - 1)
-            elif key == 'down':
-                if view_mode == 'list':
-                    # Navigate sessions in list view
-                    selected_idx = min(len(sessions) - 1, selected_idx + 1)
-                else:
-                    # Scroll down in detail/logs view (1 line)
-                    scroll_offset += 1  # Will be clamped in paginate_content
-            elif key == 'pgup':
-                if view_mode != 'list':
-                    # Scroll up one page
-                    scroll_offset = max(0, scroll_offset - page_height)
-            elif key == 'pgdn':
-                if view_mode != 'list':
-                    # Scroll down one page
-                    scroll_offset += page_height  # Will be clamped in paginate_content
-            elif key == 'n':  # Next session (in detail/logs view)
-                if view_mode in ['detail', 'logs']:
-                    selected_idx = min(len(sessions) - 1, selected_idx + 1)
-                    scroll_offset = 0  # Reset scroll for new session
-            elif key == 'p':  # Previous session (in detail/logs view)
-                if view_mode in ['detail', 'logs']:
-                    selected_idx = max(0, selected_idx - 1)
-                    scroll_offset = 0  # Reset scroll for new session
-            elif key in ['\r', '\n', 'v']:  # Enter or 'v'
-                if view_mode == 'list':
-                    view_mode = 'detail'
-                    scroll_offset = 0
-                elif view_mode in ['detail', 'logs']:
-                    view_mode = 'list'
-                    scroll_offset = 0
-            elif key == 'l':  # View logs
-                view_mode = 'logs'
-                scroll_offset = 0
-            elif key == 'b' and view_mode in ['detail', 'logs']:
-                view_mode = 'list'
-                scroll_offset = 0
-            elif key == 'r':
-                resume_session(sessions[selected_idx], fork=False)
-                break
-            elif key == 'f':
-                resume_session(sessions[selected_idx], fork=True)
-                break
+                # Index the file once; scrolling then reads only the visible lines
+                log_content = log_views.get(log_path)
+                if log_content is None:
+                    log_content = log_views[log_path] = LogView(log_path)
+                log_content.refresh()
+                if log_content.is_empty:
+                    log_content = ["[dim]Log file is empty[/dim]"]
+            except Exception as e:
+                log_content = ["[red]Error reading log file:[/red]", str(e)]
+
+        # Paginate log content
+        visible_lines, total_lines, scroll_offset = paginate_content(
+            log_content, scroll_offset, page_height
+        )
 
-    except ImportError:
-        # Fallback: non-interactive mode
-        console.print("[yellow]Interactive mode not available (termios not found)[/yellow]")
-        console.print("[yellow]Use --list to view sessions non-interactively[/yellow]")
+        # Show header with scroll position
+        layout["header"].update(Text.from_markup(
+            f"[bold cyan]Logs: {session.short_id}[/bold cyan]\n"
+            f"[dim]↑/↓: Scroll (PgUp/PgDn: Fast) | n/p: Next/Prev Session | b: Back | q: Quit[/dim]"
+        ))
+        layout["footer"].update(Text.from_markup(
+            f"[dim]Lines {scroll_offset + 1}-{min(scroll_offset + page_height, total_lines)} of {total_lines}[/dim]"
+        ))
+
+        # Show paginated content
+        layout["body"].update(Panel(
+            '\n'.join(visible_lines),
+            border_style="green"
+        ))
+
+    # Each view updates the layout regions it owns
+    views = {
+        'list': render_list,
+        'detail': render_detail,
+        'logs': render_logs,
+    }
+
+    # Key handlers; each returns True to leave the browser
+    def on_quit(count: int, page_height: int) -> bool:
+        return True
+
+    def on_up(count: int, page_height: int) -> bool:
+        nonlocal selected_idx, scroll_offset
+        if view_mode == 'list':
+            # Navigate sessions in list view
+            selected_idx = max(0, selected_idx - count)
+        else:
+            # Scroll up in detail/logs view (1 line per press)
+            scroll_offset = max(0, scroll_offset - count)
+        return False
+
+    def on_down(count: int, page_height: int) -> bool:
+        nonlocal selected_idx, scroll_offset
+        if view_mode == 'list':
+            # Navigate sessions in list view
+            selected_idx = min(len(sessions) - 1, selected_idx + count)
+        else:
+            # Scroll down in detail/logs view (1 line per press)
+            scroll_offset += count  # Will be clamped in paginate_content
+        return False
+
+    def on_page_up(count: int, page_height: int) -> bool:
+        nonlocal scroll_offset
+        if view_mode != 'list':
+            # Scroll up one page per press
+            scroll_offset = max(0, scroll_offset - page_height * count)
+        return False
+
+    def on_page_down(count: int, page_height: int) -> bool:
+        nonlocal scroll_offset
+        if view_mode != 'list':
+            # Scroll down one page per press
+            scroll_offset += page_height * count  # Will be clamped in paginate_content
+        return False
+
+    def on_next(count: int, page_height: int) -> bool:
+        nonlocal selected_idx, scroll_offset
+        # Next session (in detail/logs view)
+        if view_mode in ['detail', 'logs']:
+            selected_idx = min(len(sessions) - 1, selected_idx + 1)
+            scroll_offset = 0  # Reset scroll for new session
+        return False
+
+    def on_prev(count: int, page_height: int) -> bool:
+        nonlocal selected_idx, scroll_offset
+        # Previous session (in detail/logs view)
+        if view_mode in ['detail', 'logs']:
+            selected_idx = max(0, selected_idx - 1)
+            scroll_offset = 0  # Reset scroll for new session
+        return False
+
+    def on_toggle_detail(count: int, page_height: int) -> bool:
+        nonlocal view_mode, scroll_offset
+        # Enter or 'v': open details from the list, go back from detail/logs
+        view_mode = 'detail' if view_mode == 'list' else 'list'
+        scroll_offset = 0
+        return False
+
+    def on_logs(count: int, page_height: int) -> bool:
+        nonlocal view_mode, scroll_offset
+        view_mode = 'logs'
+        scroll_offset = 0
+        return False
+
+    def on_back(count: int, page_height: int) -> bool:
+        nonlocal view_mode, scroll_offset
+        if view_mode in ['detail', 'logs']:
+            view_mode = 'list'
+            scroll_offset = 0
+        return False
+
+    def on_resume(count: int, page_height: int) -> bool:
+        nonlocal resume_target
+        resume_target = (sessions[selected_idx], False)
+        return True
+
+    def on_fork(count: int, page_height: int) -> bool:
+        nonlocal resume_target
+        resume_target = (sessions[selected_idx], True)
+        return True
+
+    key_handlers = {
+        'q': on_quit,
+        'up': on_up,
+        'down': on_down,
+        'pgup': on_page_up,
+        'pgdn': on_page_down,
+        'n': on_next,
+        'p': on_prev,
+        '\r': on_toggle_detail,
+        '\n': on_toggle_detail,
+        'v': on_toggle_detail,
+        'l': on_logs,
+        'b': on_back,
+        'r': on_resume,
+        'f': on_fork,
+    }
+
+    # Switch the terminal to unbuffered input once for the whole session.
+    # cbreak (not raw) keeps output post-processing, which Live relies on.
+    old_settings = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    # Re-query the terminal size only after a resize (SIGWINCH is POSIX-only)
+    old_winch = signal.signal(signal.SIGWINCH, _on_winch) if hasattr(signal, 'SIGWINCH') else None
+    try:
+        with Live(layout, console=console, screen=True, auto_refresh=False) as live:
+            while True:
+                # Get terminal height for pagination (reserve space for header/footer)
+                term_height = get_terminal_height()
+                page_height = term_height - 5  # Reserve lines for header, footer, panel borders
+
+                # Update layout regions for the current view
+                views[view_mode](term_height, page_height)
+
+                # Draw changed regions, then wait for input
+                live.refresh()
+                key, count = get_key()
+
+                handler = key_handlers.get(key)
+                if handler is not None and handler(count, page_height):
+                    break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        if old_winch is not None:
+            signal.signal(signal.SIGWINCH, old_winch)
+
+    if resume_target:
+        resume_session(*resume_target)
 
 @click.command(cls=TulesCommand)
 @click.argument('directory', default=None, required=False)
@@ -484,6 +910,8 @@ def interactive_session_browser(sessions: List[Session], directory: str):
 @click.option('--agents-only', is_flag=True, help='Show only agent sessions')
 @click.option('--main-only', is_flag=True, help='Show only main sessions')
 @click.option('--list', 'list_mode', is_flag=True, help='Non-interactive list mode')
+@click.option('--all-history', is_flag=True,
+              help=f'List every session instead of the {MAX_LISTED_SESSIONS} most recent')
 def main(directory: Optional[str],
          provider: str,
          show_all: bool,
@@ -492,7 +920,8 @@ def main(directory: Optional[str],
          search: Optional[str],
          agents_only: bool,
          main_only: bool,
-         list_mode: bool):
+         list_mode: bool,
+         all_history: bool):
     """
     AI Session Manager - View and manage sessions (folder-based)
 
@@ -524,9 +953,25 @@ def main(directory: Optional[str],
 
     console.print(f"[dim]Using provider: {ai_provider.get_name()}[/dim]\n")
 
+    # Filters must see the whole history; otherwise only the newest sessions are listed
+    has_filters = bool(since or before or search or agents_only or main_only)
+    top_k = None if all_history or has_filters else MAX_LISTED_SESSIONS
+
+    # Lets discovery skip files too old to match before parsing them
+    since_date = parse_date_bound(since) if since else None
+
+    # Compile the search regex once for every directory group below
+    pattern = None
+    if search:
+        try:
+            pattern = _compile_search(search)
+        except re.error as e:
+            console.print(f"[red]Invalid search pattern: {e}[/red]")
+            return
+
     if show_all:
         # Show all sessions grouped by directory
-        all_sessions = find_all_sessions(ai_provider)
+        all_sessions = find_all_sessions(ai_provider, top_k, since_date)
 
         if not all_sessions:
             console.print("[yellow]No sessions found[/yellow]")
@@ -534,7 +979,7 @@ def main(directory: Optional[str],
 
         for dir_path, sessions in all_sessions.items():
             # Apply filters
-            filtered = filter_sessions(sessions, since, before, search, agents_only, main_only)
+            filtered = filter_sessions(sessions, since, before, pattern, agents_only, main_only)
 
             if filtered:
                 table = create_session_table(filtered, dir_path)
@@ -543,13 +988,14 @@ def main(directory: Optional[str],
 
     else:
         # Show sessions for specific directory
-        target_dir = directory if directory else os.getcwd()
-        target_dir = os.path.abspath(target_dir)
+        # Make absolute once here; everything below reuses the Path. abspath keeps
+        # symlinked paths as typed, matching how the providers key sessions
+        target_dir = Path(os.path.abspath(directory or _cwd()))
 
-        sessions = find_sessions_for_directory(target_dir, ai_provider)
+        sessions = find_sessions_for_directory(target_dir, ai_provider, top_k, since_date)
 
         # Apply filters
-        sessions = filter_sessions(sessions, since, before, search, agents_only, main_only)
+        sessions = filter_sessions(sessions, since, before, pattern, agents_only, main_only)
 
         if not sessions:
             console.print(f"[yellow]No sessions found for {target_dir}[/yellow]")
@@ -558,11 +1004,13 @@ def main(directory: Optional[str],
 
         if list_mode:
             # Non-interactive list mode
-            table = create_session_table(sessions, target_dir)
+            table = create_session_table(sessions, str(target_dir))
             console.print(table)
+            if top_k is not None and len(sessions) == top_k:
+                console.print(f"[dim]Showing the {top_k} most recent sessions (use --all-history for more)[/dim]")
         else:
             # Interactive TUI mode
-            interactive_session_browser(sessions, target_dir)
+            interactive_session_browser(sessions, str(target_dir))
 
 if __name__ == '__main__':
     main()
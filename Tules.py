@@ -7,25 +7,22 @@ Supports both Claude Code and Gemini CLI backends.
 
 import os
 import sys
-import json
 import uuid
 import subprocess
 import signal
 import re
-import glob
+import functools
+import hashlib
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Confirm
 import time
 
 # Import AI provider abstraction
-from ai_provider import get_provider, detect_provider, get_all_providers
+from ai_provider import get_provider, detect_provider, get_all_providers, json_loads, json_dumps
 from banner import print_banner_tules
 
 console = Console()
@@ -61,47 +58,146 @@ def init_config(provider_name: Optional[str] = None):
 
     return provider
 
+# bg-agents directories already set up by this process
+_ensured_dirs = set()
+
 def ensure_dirs():
-    """Ensure required directories exist"""
+    """Ensure required directories exist (checked once per process)"""
+    if BG_AGENTS_DIR in _ensured_dirs:
+        return
     BG_AGENTS_DIR.mkdir(parents=True, exist_ok=True)
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
     if not SESSIONS_FILE.exists():
-        SESSIONS_FILE.write_text('[]')
+        SESSIONS_FILE.write_bytes(b'[]')
+    _ensured_dirs.add(BG_AGENTS_DIR)
+
+def write_atomic(path: Path, data: bytes):
+    """Write a file via a temporary sibling and rename, so readers never see it half-written"""
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+# Parsed sessions.json contents keyed by path, validated by (mtime_ns, size)
+_sessions_cache: Dict[Path, tuple] = {}
+
+def _stat_key(path: Path) -> tuple:
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+def load_sessions(bg_dir: Optional[Path] = None) -> List[Dict]:
+    """Load session metadata (for the active provider unless `bg_dir` is given)"""
+    if bg_dir is None:
+        ensure_dirs()
+        sessions_file = SESSIONS_FILE
+    else:
+        sessions_file = bg_dir / 'sessions.json'
 
-def load_sessions() -> List[Dict]:
-    """Load session metadata"""
-    ensure_dirs()
     try:
-        return json.loads(SESSIONS_FILE.read_text())
+        key = _stat_key(sessions_file)
+        cached = _sessions_cache.get(sessions_file)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        sessions = json_loads(sessions_file.read_bytes())
+        _sessions_cache[sessions_file] = (key, sessions)
+        return sessions
     except:
         return []
 
+def load_all_sessions() -> List[Dict]:
+    """Load session metadata from every available provider"""
+    all_sessions = []
+    for provider in get_all_providers():
+        all_sessions.extend(load_sessions(provider.get_bg_agents_dir()))
+    return all_sessions
+
 def save_sessions(sessions: List[Dict]):
     """Save session metadata"""
     ensure_dirs()
-    SESSIONS_FILE.write_text(json.dumps(sessions, indent=2))
+    _sessions_cache.pop(SESSIONS_FILE, None)
+    write_atomic(SESSIONS_FILE, json_dumps(sessions))
+    # What was just written is what the next load would parse
+    _sessions_cache[SESSIONS_FILE] = (_stat_key(SESSIONS_FILE), sessions)
 
-def check_git_repo() -> bool:
-    """Check if current directory is a git repository"""
-    try:
-        subprocess.run(['git', 'rev-parse', '--git-dir'], capture_output=True, check=True, cwd=os.getcwd())
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+def _read_tail_bytes(f, end: int, lines: int, chunk_size: int = 64 * 1024) -> bytes:
+    """Return the last `lines` lines before offset `end`, reading backwards
 
-def get_current_branch() -> Optional[str]:
-    """Get the current git branch name"""
+    Only b'\n' ends a line, as with tail -n; a CR inside a line (progress
+    bars in docker/pip output) is kept as part of it.
+    """
+    if lines <= 0 or end <= 0:
+        return b''
+
+    data = b''
+    # Grow the window until it holds enough newlines (or the whole file)
+    while end > 0 and data.count(b'\n') <= lines:
+        read_size = min(chunk_size, end)
+        end -= read_size
+        f.seek(end)
+        data = f.read(read_size) + data
+        chunk_size *= 2
+
+    parts = data.split(b'\n')
+    # A final newline terminates the last line rather than starting a new one
+    terminated = parts[-1] == b''
+    if terminated:
+        parts.pop()
+    tail = b'\n'.join(parts[-lines:])
+    return tail + b'\n' if terminated else tail
+
+def read_tail(path: Path, lines: int, chunk_size: int = 64 * 1024) -> str:
+    """Return the last `lines` lines of a file, reading backwards from the end"""
+    with open(path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        data = _read_tail_bytes(f, end, lines, chunk_size)
+    return data.decode('utf-8', errors='replace')
+
+def follow_file(path: Path, lines: int = 10, poll_interval: float = 0.1):
+    """Print the last `lines` lines of a file, then stream appended output (like tail -f)"""
+    out = sys.stdout.buffer
+    with open(path, 'rb') as f:
+        # Tail and follow from the same offset so nothing is shown twice or lost
+        size = f.seek(0, os.SEEK_END)
+        out.write(_read_tail_bytes(f, size, lines))
+        out.flush()
+        f.seek(size)
+
+        # Poll for new bytes and copy them through unmodified
+        while True:
+            chunk = f.read(64 * 1024)
+            if chunk:
+                out.write(chunk)
+                out.flush()
+            else:
+                time.sleep(poll_interval)
+
+def get_git_head(cwd: str) -> Optional[str]:
+    """Current git branch name in one git call
+
+    Returns None outside a git repository and '' on a detached HEAD.
+    """
     try:
-        result = subprocess.run(['git', 'branch', '--show-current'], capture_output=True, text=True, check=True, cwd=os.getcwd())
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        result = subprocess.run(['git', 'symbolic-ref', '--short', '-q', 'HEAD'],
+                                capture_output=True, text=True, cwd=cwd)
+    except FileNotFoundError:
         return None
 
+    # Exit status 1 with -q means HEAD isn't a branch; anything else is an error
+    if result.returncode == 0:
+        return result.stdout.strip()
+    if result.returncode == 1:
+        return ''
+    return None
+
+# Branch-name cleanup patterns, compiled once
+_BRANCH_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def sanitize_branch_name(prompt: str, session_id: str, provider_name: str = 'ai') -> str:
     """Generate a sanitized branch name from prompt and session ID"""
     # Take first 40 chars of prompt, remove special chars, convert to kebab-case
-    sanitized = re.sub(r'[^a-zA-Z0-9\s-]', '', prompt[:40])
-    sanitized = re.sub(r'\s+', '-', sanitized).strip('-').lower()
+    sanitized = _BRANCH_UNSAFE_RE.sub('', prompt[:40])
+    sanitized = _WHITESPACE_RE.sub('-', sanitized).strip('-').lower()
 
     # Ensure it's not empty
     if not sanitized:
@@ -111,11 +207,11 @@ def sanitize_branch_name(prompt: str, session_id: str, provider_name: str = 'ai'
     short_id = session_id[:8]
     return f'tules-{provider_name}/{sanitized}-{short_id}'
 
-def create_git_branch(branch_name: str) -> bool:
+def create_git_branch(branch_name: str, cwd: str) -> bool:
     """Create and checkout a new git branch"""
     try:
         # Create and checkout new branch
-        subprocess.run(['git', 'checkout', '-b', branch_name], capture_output=True, check=True, cwd=os.getcwd())
+        subprocess.run(['git', 'checkout', '-b', branch_name], capture_output=True, check=True, cwd=cwd)
         return True
     except subprocess.CalledProcessError as e:
         console.print(f"[red]Failed to create branch: {e.stderr.decode()}[/red]")
@@ -129,22 +225,24 @@ def check_docker() -> bool:
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
-def ensure_docker_image(provider_name: str = 'claude') -> bool:
-    """Ensure Docker image is built for the given provider"""
-    image_name = f'tules-{provider_name}:latest'
+def _build_inputs_digest(dockerfile: Path) -> str:
+    """Hash of the files baked into the image (Dockerfile and entrypoint)"""
+    digest = hashlib.sha256(dockerfile.read_bytes())
+    entrypoint = dockerfile.parent / 'docker-entrypoint.sh'
+    if entrypoint.exists():
+        digest.update(entrypoint.read_bytes())
+    return digest.hexdigest()
 
-    # Check if image exists
-    result = subprocess.run(
-        ['docker', 'images', '-q', image_name],
-        capture_output=True,
-        text=True
-    )
-
-    if result.stdout.strip():
-        return True
+def ensure_docker_image(provider_name: str = 'claude') -> bool:
+    """Ensure Docker image is built for the given provider
 
-    # Build image if it doesn't exist
-    console.print(f"[yellow]Building {provider_name} Docker image (first time only)...[/yellow]")
+    The digest of the build inputs is recorded in image_state.json after a
+    successful check or build; while it still matches and the image exists,
+    no rebuild is attempted. A present image also proves the daemon is up, so
+    that path costs a single `docker image inspect` and `docker info` only
+    runs when the image check fails.
+    """
+    image_name = f'tules-{provider_name}:latest'
     dockerfile_dir = Path(__file__).resolve().parent
 
     # Check if provider-specific Dockerfile exists
@@ -153,23 +251,112 @@ def ensure_docker_image(provider_name: str = 'claude') -> bool:
         # Fall back to generic Dockerfile
         dockerfile = dockerfile_dir / 'Dockerfile'
 
-    if not dockerfile.exists():
+    digest = _build_inputs_digest(dockerfile) if dockerfile.exists() else None
+    state_file = BG_AGENTS_DIR / 'image_state.json'
+    try:
+        state = json_loads(state_file.read_bytes())
+    except (OSError, ValueError):
+        state = {}
+
+    # Check if image exists; a matching digest alone doesn't survive `docker rmi`
+    try:
+        result = subprocess.run(
+            ['docker', 'image', 'inspect', '--format', '{{.Id}}', image_name],
+            capture_output=True,
+            text=True
+        )
+        image_exists = result.returncode == 0
+    except FileNotFoundError:
+        image_exists = False
+
+    # An existing image is reused unless it was built from different inputs
+    if image_exists and (digest is None or state.get(image_name, digest) == digest):
+        if digest is not None and image_name not in state:
+            state[image_name] = digest
+            write_atomic(state_file, json_dumps(state))
+        return True
+
+    if not image_exists and not check_docker():
+        console.print("[red]Error: Docker is not available. Please install Docker.[/red]")
+        return False
+
+    if digest is None:
         console.print(f"[red]Dockerfile not found at {dockerfile}[/red]")
         return False
 
+    # Build image if it doesn't exist or is out of date
+    console.print(f"[yellow]Building {provider_name} Docker image...[/yellow]")
+
+    # BuildKit reuses cached layers; output goes to a log instead of memory
+    build_log = BG_AGENTS_DIR / 'build.log'
+    build_cmd = [
+        'docker', 'build', '--progress=plain',
+        '--build-arg', 'BUILDKIT_INLINE_CACHE=1',
+        '--cache-from', image_name,
+        '-f', str(dockerfile), '-t', image_name, str(dockerfile_dir),
+    ]
+
     try:
-        subprocess.run(
-            ['docker', 'build', '-f', str(dockerfile), '-t', image_name, str(dockerfile_dir)],
-            check=True,
-            capture_output=True
-        )
+        with open(build_log, 'wb') as log_file:
+            subprocess.run(
+                build_cmd,
+                check=True,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                env={**os.environ, 'DOCKER_BUILDKIT': '1'}
+            )
         console.print(f"[green]{provider_name} Docker image built successfully[/green]")
+        state[image_name] = digest
+        write_atomic(state_file, json_dumps(state))
         return True
     except subprocess.CalledProcessError as e:
-        console.print(f"[red]Failed to build Docker image: {e}[/red]")
+        console.print(f"[red]Failed to build Docker image: {e} (see {build_log})[/red]")
         return False
 
-def run_background(prompt: str, provider, session_id: Optional[str] = None, use_sandbox: bool = True) -> str:
+def ensure_warm_container(provider, cwd: str, home: str, binary_path: str) -> Optional[str]:
+    """Start (or reuse) a long-lived container for this provider and directory
+
+    Tasks are then started with `docker exec`, skipping container start-up.
+    Returns the container name, or None if it could not be started.
+    """
+    provider_name = provider.get_name()
+    digest = hashlib.sha1(cwd.encode('utf-8')).hexdigest()[:8]
+    container_name = f'tules-pool-{provider_name}-{digest}'
+
+    result = subprocess.run(
+        ['docker', 'inspect', '-f', '{{.State.Running}}', container_name],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode == 0 and result.stdout.strip() == 'true':
+        return container_name
+
+    # Replace a stopped leftover with the same name
+    subprocess.run(['docker', 'rm', '-f', container_name], capture_output=True)
+
+    uid = os.getuid()
+    gid = os.getgid()
+    if provider_name == 'gemini':
+        user_args = ['-e', f'USER_ID={uid}', '-e', f'GROUP_ID={gid}']
+    else:
+        user_args = ['--user', f'{uid}:{gid}']
+
+    cmd = ['docker', 'run', '-d', '--name', container_name] + user_args + \
+        provider.get_docker_mounts(cwd, home, binary_path) + [
+            '-w', '/workspace',
+            '-e', f'HOME={home}',
+            f'tules-{provider_name}:latest',
+            'sleep', 'infinity',
+        ]
+    try:
+        subprocess.run(cmd, capture_output=True, check=True)
+    except subprocess.CalledProcessError as e:
+        console.print(f"[red]Failed to start warm container: {e.stderr.decode()}[/red]")
+        return None
+    return container_name
+
+def run_background(prompt: str, provider, session_id: Optional[str] = None, use_sandbox: bool = True,
+                   warm: bool = False) -> str:
     """
     Run AI agent in background with sandbox + skip-permissions
 
@@ -178,6 +365,7 @@ def run_background(prompt: str, provider, session_id: Optional[str] = None, use_
         provider: AI provider instance
         session_id: Optional session ID (will generate if not provided)
         use_sandbox: Whether to use Docker sandboxing
+        warm: Run inside a reused per-directory container instead of a fresh one
 
     Returns:
         Session ID
@@ -185,14 +373,18 @@ def run_background(prompt: str, provider, session_id: Optional[str] = None, use_
     if session_id is None:
         session_id = str(uuid.uuid4())
 
+    # Branch, mounts and session record all use the same directory
+    cwd = os.getcwd()
+
     # Check if we're in a git repo and create a branch
     branch_name = None
     original_branch = None
-    if check_git_repo():
-        original_branch = get_current_branch()
+    head = get_git_head(cwd)
+    if head is not None:
+        original_branch = head
         branch_name = sanitize_branch_name(prompt, session_id, provider.get_name())
 
-        if not create_git_branch(branch_name):
+        if not create_git_branch(branch_name, cwd):
             console.print("[yellow]Warning: Failed to create branch, continuing without branch isolation[/yellow]")
             branch_name = None
     else:
@@ -202,18 +394,39 @@ def run_background(prompt: str, provider, session_id: Optional[str] = None, use_
     log_path = LOGS_DIR / f'{session_id}.log'
 
     # Use Docker for sandboxing
-    if use_sandbox:
-        if not check_docker():
-            console.print("[red]Error: Docker is not available. Please install Docker.[/red]")
-            console.print("[yellow]Falling back to non-sandboxed execution[/yellow]")
-            use_sandbox = False
-        elif not ensure_docker_image(provider.get_name()):
-            console.print("[yellow]Falling back to non-sandboxed execution[/yellow]")
-            use_sandbox = False
-
-    if use_sandbox:
+    if use_sandbox and not ensure_docker_image(provider.get_name()):
+        console.print("[yellow]Falling back to non-sandboxed execution[/yellow]")
+        use_sandbox = False
+
+    pool_name = None
+    if use_sandbox and warm:
+        pool_name = ensure_warm_container(provider, cwd, str(Path.home()), provider.get_binary_path())
+        if pool_name is None:
+            console.print("[yellow]Falling back to a fresh container[/yellow]")
+
+    if pool_name:
+        # Run in the already-started container; the task records its PID there
+        # so `kill` can reach it (killing `docker exec` doesn't stop the task)
+        cmd = [
+            'docker', 'exec',
+            '--user', f'{os.getuid()}:{os.getgid()}',
+            '-w', '/workspace',
+            '-e', f'SESSION_ID={session_id}',
+            '-e', f'HOME={Path.home()}',
+            pool_name,
+            'sh', '-c', 'echo $$ > "/tmp/tules-$SESSION_ID.pid"; exec "$@"', 'sh',
+        ] + provider.get_run_command(prompt, session_id, 'text')
+
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=open(log_path, 'w', buffering=1),
+            stderr=subprocess.STDOUT,
+            start_new_session=True
+        )
+
+    elif use_sandbox:
         # Run in Docker container
-        cwd = os.getcwd()
         home = str(Path.home())
         binary_path = provider.get_binary_path()
 
@@ -253,23 +466,13 @@ def run_background(prompt: str, provider, session_id: Optional[str] = None, use_
             f'tules-{provider.get_name()}:latest',
         ] + provider.get_run_command(prompt, session_id, 'text')
 
-        # Run in background and capture logs using docker logs
+        # Run in background; the attached container output goes straight to the log
         process = subprocess.Popen(
             cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True
-        )
-
-        # Wait a moment for container to start, then stream logs to file
-        time.sleep(0.5)
-
-        # Start a background process to capture docker logs
-        log_cmd = ['docker', 'logs', '-f', container_name]
-        subprocess.Popen(
-            log_cmd,
+            stdin=subprocess.DEVNULL,
             stdout=open(log_path, 'w', buffering=1),
-            stderr=subprocess.STDOUT
+            stderr=subprocess.STDOUT,
+            start_new_session=True
         )
 
     else:
@@ -281,7 +484,7 @@ def run_background(prompt: str, provider, session_id: Optional[str] = None, use_
             stdin=subprocess.DEVNULL,
             stdout=open(log_path, 'w', buffering=1),
             stderr=subprocess.STDOUT,
-            cwd=os.getcwd(),
+            cwd=cwd,
             start_new_session=True
         )
 
@@ -293,24 +496,65 @@ def run_background(prompt: str, provider, session_id: Optional[str] = None, use_
         'status': 'running',
         'pid': process.pid,
         'started': datetime.now().isoformat(),
-        'cwd': os.getcwd(),
+        'cwd': cwd,
         'log_path': str(log_path),
-        'sandboxed': use_sandbox and check_docker(),
+        'sandboxed': use_sandbox,  # already False if docker was unavailable
         'branch': branch_name,
         'original_branch': original_branch,
-        'provider': provider.get_name()  # Store provider name
+        'provider': provider.get_name(),  # Store provider name
+        'pool': pool_name
     })
     save_sessions(sessions)
 
     return session_id
 
-def get_session_status(session: Dict) -> str:
-    """Check if session process is still running"""
+def live_pids() -> Optional[set]:
+    """All running PIDs from a single /proc scan (None where /proc is unavailable)"""
     try:
-        os.kill(session['pid'], 0)  # Signal 0 just checks if process exists
-        return 'running'
+        return {int(entry.name) for entry in os.scandir('/proc') if entry.name.isdigit()}
     except OSError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _boot_time() -> float:
+    with open('/proc/stat') as f:
+        for line in f:
+            if line.startswith('btime '):
+                return float(line.split()[1])
+    raise OSError('btime not found in /proc/stat')
+
+def _pid_start_time(pid: int) -> Optional[datetime]:
+    """When a process started, from /proc/<pid>/stat (None if it can't be read)"""
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            # Fields after the parenthesised command name; starttime is field 22
+            fields = f.read().rsplit(')', 1)[1].split()
+        ticks = int(fields[19])
+        return datetime.fromtimestamp(_boot_time() + ticks / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        return None
+
+def get_session_status(session: Dict, live: Optional[set] = None) -> str:
+    """Check if session process is still running
+
+    `live` is a PID set from live_pids(); without it each PID is probed with
+    signal 0.
+    """
+    if live is None:
+        try:
+            os.kill(session['pid'], 0)  # Signal 0 just checks if process exists
+            return 'running'
+        except OSError:
+            return 'completed'
+
+    if session['pid'] not in live:
+        return 'completed'
+
+    # A process that started after the session was recorded is a reused PID
+    started = _pid_start_time(session['pid'])
+    if started is not None and started > datetime.fromisoformat(session['started']) + timedelta(seconds=5):
         return 'completed'
+    return 'running'
 
 class TulesGroup(click.Group):
     def format_help(self, ctx, formatter):
@@ -345,13 +589,15 @@ def cli(ctx, provider):
 
 @cli.command()
 @click.argument('prompt')
+@click.option('--warm', is_flag=True,
+              help='Reuse a long-lived container for this directory (remove with docker rm -f tules-pool-...)')
 @click.pass_context
-def run(ctx, prompt: str):
+def run(ctx, prompt: str, warm: bool):
     """Run a single task in background (always sandboxed)"""
     provider = ctx.obj['provider']
     ensure_dirs()
 
-    session_id = run_background(prompt, provider, use_sandbox=True)
+    session_id = run_background(prompt, provider, use_sandbox=True, warm=warm)
 
     # Get session info to display branch
     sessions = load_sessions()
@@ -361,13 +607,14 @@ def run(ctx, prompt: str):
     if session and session.get('branch'):
         branch_info = f"Branch: [magenta]{session['branch']}[/magenta]\n"
 
+    from rich.panel import Panel
     console.print(Panel(
         f"[green]Background agent started[/green]\n\n"
         f"Provider: [blue]{provider.get_name()}[/blue]\n"
         f"Session ID: [cyan]{session_id}[/cyan]\n"
         f"Prompt: {prompt[:60]}{'...' if len(prompt) > 60 else ''}\n"
         f"{branch_info}"
-        f"Sandboxed: {'Yes (Docker)' if check_docker() else 'No (Docker not available)'}\n\n"
+        f"Sandboxed: {'Yes (Docker)' if session and session.get('sandboxed') else 'No (Docker not available)'}\n\n"
         f"View logs: [yellow]Tules logs {session_id[:8]}[/yellow]",
         title="🤖 Agent Started",
         border_style="green"
@@ -379,30 +626,16 @@ def run(ctx, prompt: str):
 def list(show_all: bool, provider_filter: Optional[str]):
     """List all background agents from all providers"""
     # Load sessions from all available providers
-    all_sessions = []
-    for provider in get_all_providers():
-        if not provider.is_available():
-            continue
-
-        # Temporarily set config for this provider
-        old_config = (BG_AGENTS_DIR, SESSIONS_FILE, LOGS_DIR)
-        init_config(provider.get_name())
-
-        provider_sessions = load_sessions()
-        all_sessions.extend(provider_sessions)
-
-        # Restore original config
-        globals()['BG_AGENTS_DIR'], globals()['SESSIONS_FILE'], globals()['LOGS_DIR'] = old_config
-
-    sessions = all_sessions
+    sessions = load_all_sessions()
 
     if not sessions:
         console.print("[yellow]No background agents found[/yellow]")
         return
 
-    # Update statuses
+    # Update statuses from one /proc scan rather than a probe per session
+    live = live_pids()
     for session in sessions:
-        session['status'] = get_session_status(session)
+        session['status'] = get_session_status(session, live)
 
     # Apply provider filter if specified
     if provider_filter:
@@ -416,6 +649,9 @@ def list(show_all: bool, provider_filter: Optional[str]):
         console.print("[yellow]No running agents found (use --all to see completed)[/yellow]")
         return
 
+    # Deferred: rich.table is the largest remaining import and only list needs it
+    from rich.table import Table
+
     table = Table(title="Background Agents")
     table.add_column("Session ID", style="cyan")
     table.add_column("Provider", style="blue")
@@ -438,7 +674,7 @@ def list(show_all: bool, provider_filter: Optional[str]):
             f"[{status_color}]{session['status']}[/{status_color}]",
             session['prompt'][:30],
             branch_display if branch_display else "N/A",
-            datetime.fromisoformat(session['started']).strftime("%Y-%m-%d %H:%M"),
+            session['started'][:16].replace('T', ' '),  # isoformat() -> "YYYY-MM-DD HH:MM"
             "Yes" if session.get('sandboxed', False) else "No"
         )
 
@@ -451,20 +687,7 @@ def list(show_all: bool, provider_filter: Optional[str]):
 def logs(session_id: str, follow: bool, lines: int):
     """View logs for a specific session from any provider"""
     # Load sessions from all available providers
-    all_sessions = []
-    for provider in get_all_providers():
-        if not provider.is_available():
-            continue
-
-        # Temporarily set config for this provider
-        old_config = (BG_AGENTS_DIR, SESSIONS_FILE, LOGS_DIR)
-        init_config(provider.get_name())
-
-        provider_sessions = load_sessions()
-        all_sessions.extend(provider_sessions)
-
-        # Restore original config
-        globals()['BG_AGENTS_DIR'], globals()['SESSIONS_FILE'], globals()['LOGS_DIR'] = old_config
+    all_sessions = load_all_sessions()
 
     # Find matching session (allow partial ID)
     matching = [s for s in all_sessions if s['id'].startswith(session_id)]
@@ -488,17 +711,14 @@ def logs(session_id: str, follow: bool, lines: int):
         # Follow mode (like tail -f)
         console.print(f"[cyan]Following logs for {session['id'][:8]}...[/cyan] (Ctrl+C to stop)\n")
         try:
-            process = subprocess.Popen(['tail', '-f', str(log_path)], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            for line in process.stdout:
-                console.print(line, end='')
+            follow_file(log_path, lines)
         except KeyboardInterrupt:
-            process.terminate()
             console.print("\n[yellow]Stopped following logs[/yellow]")
     else:
-        # Show last N lines
-        result = subprocess.run(['tail', f'-n{lines}', str(log_path)], capture_output=True, text=True)
+        # Show last N lines (read in-process instead of forking tail)
+        from rich.panel import Panel
         console.print(Panel(
-            result.stdout,
+            read_tail(log_path, lines),
             title=f"Logs: {session['id'][:8]}",
             border_style="cyan"
         ))
@@ -525,8 +745,24 @@ def kill(ctx, session_id: str):
     session = matching[0]
 
     try:
-        # Kill process and its children
-        os.killpg(os.getpgid(session['pid']), signal.SIGTERM)
+        if session.get('pool'):
+            # Warm-container task: signal it inside the container via its PID file
+            result = subprocess.run(
+                ['docker', 'exec', session['pool'], 'sh', '-c',
+                 f'kill "$(cat /tmp/tules-{session["id"]}.pid)"'],
+                capture_output=True
+            )
+            if result.returncode != 0:
+                raise ProcessLookupError
+        elif session.get('sandboxed'):
+            # Stop the container itself rather than signalling the docker client
+            container_name = f"tules-{session.get('provider', 'claude')}-{session['id'][:8]}"
+            result = subprocess.run(['docker', 'stop', '-t', '2', container_name], capture_output=True)
+            if result.returncode != 0:
+                raise ProcessLookupError
+        else:
+            # Kill process and its children
+            os.killpg(os.getpgid(session['pid']), signal.SIGTERM)
         console.print(f"[green]Killed {provider.get_name()} session {session['id'][:8]}[/green]")
 
         # Update status
@@ -551,6 +787,7 @@ def clear(ctx, logs: bool, force: bool):
         return
 
     if not force:
+        from rich.prompt import Confirm
         if not Confirm.ask(f"Clear {len(sessions)} sessions for {provider.get_name()}?"):
             console.print("[yellow]Cancelled[/yellow]")
             return
@@ -561,10 +798,13 @@ def clear(ctx, logs: bool, force: bool):
 
     # Optionally clear log files
     if logs:
-        log_files = glob.glob(str(LOGS_DIR / '*.log'))
-        for log_file in log_files:
-            Path(log_file).unlink()
-        console.print(f"[green]Deleted {len(log_files)} log files[/green]")
+        deleted = 0
+        with os.scandir(LOGS_DIR) as it:
+            for entry in it:
+                if entry.name.endswith('.log') and entry.is_file():
+                    os.unlink(entry.path)
+                    deleted += 1
+        console.print(f"[green]Deleted {deleted} log files[/green]")
 
 if __name__ == '__main__':
     cli()
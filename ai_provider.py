@@ -5,32 +5,101 @@ Supports both Claude Code and Gemini CLI backends
 """
 
 import os
+import re
 import json
 import hashlib
-import subprocess
+import functools
+import shutil
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+# orjson is optional; it parses large session files several times faster and
+# writes the indented metadata files much faster.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so handlers stay the same.
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def iter_session_dirents(root: Path, prefix: str = '',
+                         suffix: str = '') -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+    """Yield (entry, stat) for files (or symlinks to them) in root matching prefix/suffix
+
+    A single scandir pass; stat results come straight from the entry so
+    callers don't need a separate stat() per file.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(suffix)):
+                    continue
+                try:
+                    # Follows symlinks, as the glob() this replaced did
+                    if entry.is_file():
+                        yield entry, entry.stat()
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
+def _first_executable(candidates: List[str]) -> Optional[str]:
+    """First candidate path that is an executable file
+
+    os.access(X_OK) checks existence and the execute bit in one syscall; on
+    Windows X_OK only means "exists", so require a regular file there.
+    """
+    for path in candidates:
+        if os.access(path, os.X_OK) and (os.name != 'nt' or os.path.isfile(path)):
+            return path
+    return None
+
+
+# Marks a per-instance cache that hasn't been filled yet (None is a valid result)
+_UNSET = object()
+
 
 class AIProvider(ABC):
     """Base class for AI CLI providers"""
 
+    def __init__(self):
+        # The binary location never changes within a process; probe it once
+        self._binary_path = _UNSET
+
     @abstractmethod
     def get_name(self) -> str:
         """Get provider name"""
         pass
 
     @abstractmethod
-    def get_binary_path(self) -> Optional[str]:
-        """Get path to CLI binary"""
+    def _find_binary_path(self) -> Optional[str]:
+        """Locate the CLI binary on this system"""
         pass
 
-    @abstractmethod
+    def get_binary_path(self) -> Optional[str]:
+        """Get path to CLI binary (looked up once per instance)"""
+        if self._binary_path is _UNSET:
+            self._binary_path = self._find_binary_path()
+        return self._binary_path
+
     def is_available(self) -> bool:
         """Check if this provider is available on the system"""
-        pass
+        return self.get_binary_path() is not None
+
+    def clear_cache(self):
+        """Forget the cached binary lookup so the next call probes again"""
+        self._binary_path = _UNSET
 
     @abstractmethod
     def get_config_dir(self) -> Path:
@@ -53,57 +122,93 @@ class AIProvider(ABC):
         pass
 
     @abstractmethod
+    def get_sessions_dir(self, working_dir: str) -> Path:
+        """Get where sessions for a working directory would be stored (may not exist)"""
+        pass
+
     def get_sessions_path(self, working_dir: str) -> Optional[Path]:
         """Get path to sessions directory for a working directory"""
-        pass
+        path = self.get_sessions_dir(working_dir)
+        return path if path.exists() else None
 
     @abstractmethod
-    def parse_session_file(self, session_path: Path) -> Dict:
-        """Parse a session file and return metadata"""
+    def parse_session_file(self, session_path: Path, max_messages: Optional[int] = 20,
+                           mtime: Optional[float] = None) -> Dict:
+        """Parse a session file and return metadata
+
+        Only the first `max_messages` messages are kept (all when None);
+        `message_count` always reports the full total. Pass the file's `mtime`
+        when a directory scan already has it to skip another stat().
+        """
         pass
 
+    def parse_session_header(self, session_path: Path, mtime: Optional[float] = None) -> Dict:
+        """Parse only the listing metadata of a session (no message bodies kept)"""
+        metadata = self.parse_session_file(session_path, max_messages=0, mtime=mtime)
+        del metadata['messages']
+        return metadata
+
+    def parse_session_messages(self, session_path: Path) -> List[Dict]:
+        """Parse every message of a session (used when a session is opened)"""
+        return self.parse_session_file(session_path, max_messages=None)['messages']
+
     @abstractmethod
     def get_resume_command(self, session_id: str, fork: bool = False) -> List[str]:
         """Get command to resume a session"""
         pass
 
-    @abstractmethod
+    # Session file name pattern, used by find_session_entries
+    session_prefix = ''
+    session_suffix = ''
+
     def find_session_files(self, working_dir: str) -> List[Path]:
         """Find all session files for a working directory"""
+        return [path for path, _ in self.find_session_entries(working_dir)]
+
+    def find_session_entries(self, working_dir: str) -> List[Tuple[Path, os.stat_result]]:
+        """Find session files along with their stat results (one scandir pass)"""
+        # No exists() probe first: scanning a missing directory just yields nothing
+        return self.list_session_entries(self.get_sessions_dir(working_dir))
+
+    def list_session_entries(self, sessions_dir: Path) -> List[Tuple[Path, os.stat_result]]:
+        """List the session files (with stat results) in one sessions directory"""
+        return [(Path(entry.path), st) for entry, st in
+                iter_session_dirents(sessions_dir, self.session_prefix, self.session_suffix)]
+
+    @abstractmethod
+    def find_all_sessions_dirs(self) -> List[Path]:
+        """Find the sessions directory of every project the provider has recorded"""
         pass
 
 
+# JSONL record types that are conversation messages
+_CLAUDE_MESSAGE_TYPES = frozenset(('user', 'assistant'))
+
+# Spots a message record's type field without decoding the line
+_CLAUDE_MESSAGE_TYPE_RE = re.compile(rb'"type"\s*:\s*"(?:user|assistant)"')
+
+
 class ClaudeProvider(AIProvider):
     """Claude Code CLI provider"""
 
+    session_suffix = '.jsonl'
+
     def get_name(self) -> str:
         return "claude"
 
-    def get_binary_path(self) -> Optional[str]:
+    def _find_binary_path(self) -> Optional[str]:
         """Find Claude binary"""
         # Common locations
-        candidates = [
-            Path.home() / '.local' / 'bin' / 'claude',
-            Path('/usr/local/bin/claude'),
-            Path('/usr/bin/claude')
-        ]
+        found = _first_executable([
+            os.path.join(os.path.expanduser('~'), '.local', 'bin', 'claude'),
+            '/usr/local/bin/claude',
+            '/usr/bin/claude',
+        ])
+        if found:
+            return found
 
-        for path in candidates:
-            if path.exists() and os.access(path, os.X_OK):
-                return str(path)
-
-        # Try which command
-        try:
-            result = subprocess.run(['which', 'claude'], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
-            pass
-
-        return None
-
-    def is_available(self) -> bool:
-        return self.get_binary_path() is not None
+        # Fall back to a PATH search (in-process, no `which` subprocess)
+        return shutil.which('claude')
 
     def get_config_dir(self) -> Path:
         return Path.home() / '.claude'
@@ -132,54 +237,89 @@ class ClaudeProvider(AIProvider):
         """Encode directory path for Claude storage (/ -> -)"""
         return path.replace('/', '-')
 
-    def get_sessions_path(self, working_dir: str) -> Optional[Path]:
+    def get_sessions_dir(self, working_dir: str) -> Path:
         """Get Claude sessions directory"""
         encoded = self._encode_directory(os.path.abspath(working_dir))
-        path = self.get_config_dir() / 'projects' / encoded
-        return path if path.exists() else None
+        return self.get_config_dir() / 'projects' / encoded
 
-    def find_session_files(self, working_dir: str) -> List[Path]:
-        """Find all Claude session files (JSONL)"""
-        sessions_path = self.get_sessions_path(working_dir)
-        if not sessions_path:
+    def find_all_sessions_dirs(self) -> List[Path]:
+        """Every ~/.claude/projects/<encoded-dir> directory"""
+        try:
+            with os.scandir(self.get_config_dir() / 'projects') as it:
+                return [Path(entry.path) for entry in it if entry.is_dir()]
+        except OSError:
             return []
 
-        return list(sessions_path.glob('*.jsonl'))
-
-    def parse_session_file(self, session_path: Path) -> Dict:
-        """Parse Claude JSONL session file"""
-        metadata = {
+    def _new_metadata(self, session_path: Path, mtime: Optional[float]) -> Dict:
+        """Metadata defaults for a session file, before any of it is read"""
+        return {
             'id': session_path.stem,
             'summary': 'No summary',
             'cwd': None,
             'git_branch': None,
-            'timestamp': datetime.fromtimestamp(session_path.stat().st_mtime),
+            'timestamp': datetime.fromtimestamp(session_path.stat().st_mtime if mtime is None else mtime),
             'is_agent': session_path.stem.startswith('agent-'),
-            'messages': []
+            'messages': [],
+            'message_count': 0
         }
 
+    def parse_session_header(self, session_path: Path, mtime: Optional[float] = None) -> Dict:
+        """Decode only the first record; count the rest by their type marker"""
+        metadata = self._new_metadata(session_path, mtime)
+        del metadata['messages']
+
         try:
-            with open(session_path, 'r') as f:
-                # First line typically has summary
-                first_line = f.readline().strip()
-                if first_line:
-                    data = json.loads(first_line)
-                    metadata['summary'] = data.get('summary', 'No summary')
-                    metadata['cwd'] = data.get('cwd')
-                    metadata['git_branch'] = data.get('gitBranch')
-
-                # Parse remaining messages
-                f.seek(0)
+            with open(session_path, 'rb') as f:
+                first = f.readline().strip()
+                try:
+                    data = json_loads(first) if first else {}
+                except ValueError:
+                    data = {}
+
+                metadata['summary'] = data.get('summary', 'No summary')
+                metadata['cwd'] = data.get('cwd')
+                metadata['git_branch'] = data.get('gitBranch')
+
+                count = 1 if data.get('type') in _CLAUDE_MESSAGE_TYPES else 0
+                search = _CLAUDE_MESSAGE_TYPE_RE.search
                 for line in f:
+                    if search(line):
+                        count += 1
+                metadata['message_count'] = count
+        except (IOError, ValueError):
+            pass
+
+        return metadata
+
+    def parse_session_file(self, session_path: Path, max_messages: Optional[int] = 20,
+                           mtime: Optional[float] = None) -> Dict:
+        """Parse Claude JSONL session file"""
+        metadata = self._new_metadata(session_path, mtime)
+
+        try:
+            # Binary mode: lines go straight to the JSON parser without a text decode pass
+            with open(session_path, 'rb') as f:
+                # One forward pass; the first line typically also carries the summary
+                for line_no, line in enumerate(f):
                     line = line.strip()
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            if data.get('type') in ['user', 'assistant']:
-                                metadata['messages'].append(data)
-                        except json.JSONDecodeError:
-                            continue
-        except (IOError, json.JSONDecodeError):
+                    if not line:
+                        continue
+                    try:
+                        data = json_loads(line)
+                    except ValueError:
+                        # Malformed JSON (JSONDecodeError) or invalid UTF-8
+                        continue
+
+                    if line_no == 0:
+                        metadata['summary'] = data.get('summary', 'No summary')
+                        metadata['cwd'] = data.get('cwd')
+                        metadata['git_branch'] = data.get('gitBranch')
+
+                    if data.get('type') in _CLAUDE_MESSAGE_TYPES:
+                        metadata['message_count'] += 1
+                        if max_messages is None or len(metadata['messages']) < max_messages:
+                            metadata['messages'].append(data)
+        except (IOError, ValueError):
             pass
 
         return metadata
@@ -194,42 +334,37 @@ class ClaudeProvider(AIProvider):
 class GeminiProvider(AIProvider):
     """Gemini CLI provider"""
 
+    session_prefix = 'session-'
+    session_suffix = '.json'
+
     def get_name(self) -> str:
         return "gemini"
 
-    def get_binary_path(self) -> Optional[str]:
+    def _find_binary_path(self) -> Optional[str]:
         """Find Gemini binary"""
-        # Common locations for npm global installs
-        candidates = [
-            Path.home() / '.npm-global' / 'bin' / 'gemini',
-            Path.home() / '.nvm' / 'versions' / 'node' / '*' / 'bin' / 'gemini',
-            Path('/usr/local/bin/gemini'),
-            Path('/usr/bin/gemini')
-        ]
-
-        for path in candidates:
-            if '*' in str(path):
-                # Handle glob patterns
-                import glob
-                matches = glob.glob(str(path))
-                if matches:
-                    path = Path(matches[0])
-
-            if path.exists() and os.access(path, os.X_OK):
-                return str(path)
+        home = os.path.expanduser('~')
 
-        # Try which command
+        # nvm installs live under a per-version directory
+        nvm_matches = []
         try:
-            result = subprocess.run(['which', 'gemini'], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
+            with os.scandir(os.path.join(home, '.nvm', 'versions', 'node')) as it:
+                nvm_matches = [os.path.join(entry.path, 'bin', 'gemini')
+                               for entry in it if entry.is_dir()]
+        except OSError:
             pass
 
-        return None
-
-    def is_available(self) -> bool:
-        return self.get_binary_path() is not None
+        # Common locations for npm global installs
+        found = _first_executable([
+            os.path.join(home, '.npm-global', 'bin', 'gemini'),
+            *nvm_matches,
+            '/usr/local/bin/gemini',
+            '/usr/bin/gemini',
+        ])
+        if found:
+            return found
+
+        # Fall back to a PATH search (in-process, no `which` subprocess)
+        return shutil.which('gemini')
 
     def get_config_dir(self) -> Path:
         return Path.home() / '.gemini'
@@ -257,39 +392,43 @@ class GeminiProvider(AIProvider):
             '-v', f'{home}/.npm-global:{home}/.npm-global:ro',
         ]
 
-    def _hash_directory(self, path: str) -> str:
-        """Hash directory path for Gemini storage (SHA-256)"""
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _hash_directory(path: str) -> str:
+        """Hash directory path for Gemini storage (SHA-256, memoized per path)"""
         return hashlib.sha256(path.encode('utf-8')).hexdigest()
 
-    def get_sessions_path(self, working_dir: str) -> Optional[Path]:
+    def get_sessions_dir(self, working_dir: str) -> Path:
         """Get Gemini sessions directory"""
         project_hash = self._hash_directory(os.path.abspath(working_dir))
-        path = self.get_config_dir() / 'tmp' / project_hash / 'chats'
-        return path if path.exists() else None
+        return self.get_config_dir() / 'tmp' / project_hash / 'chats'
 
-    def find_session_files(self, working_dir: str) -> List[Path]:
-        """Find all Gemini session files (JSON)"""
-        sessions_path = self.get_sessions_path(working_dir)
-        if not sessions_path:
+    def find_all_sessions_dirs(self) -> List[Path]:
+        """Every ~/.gemini/tmp/<project-hash>/chats directory"""
+        try:
+            with os.scandir(self.get_config_dir() / 'tmp') as it:
+                candidates = [Path(entry.path) / 'chats' for entry in it if entry.is_dir()]
+        except OSError:
             return []
+        return [path for path in candidates if path.is_dir()]
 
-        return list(sessions_path.glob('session-*.json'))
-
-    def parse_session_file(self, session_path: Path) -> Dict:
+    def parse_session_file(self, session_path: Path, max_messages: Optional[int] = 20,
+                           mtime: Optional[float] = None) -> Dict:
         """Parse Gemini JSON session file"""
         metadata = {
             'id': None,
             'summary': 'No summary',
             'cwd': None,
             'git_branch': None,
-            'timestamp': datetime.fromtimestamp(session_path.stat().st_mtime),
+            'timestamp': datetime.fromtimestamp(session_path.stat().st_mtime if mtime is None else mtime),
             'is_agent': False,
-            'messages': []
+            'messages': [],
+            'message_count': 0
         }
 
         try:
-            with open(session_path, 'r') as f:
-                data = json.load(f)
+            with open(session_path, 'rb') as f:
+                data = json_loads(f.read())
 
                 metadata['id'] = data.get('sessionId', session_path.stem)
 
@@ -297,16 +436,21 @@ class GeminiProvider(AIProvider):
                 start_time = data.get('startTime')
                 if start_time:
                     try:
-                        # Remove 'Z' and parse
+                        # Remove 'Z' and parse; store as naive local time like the
+                        # mtime-based timestamps so sessions compare and sort together
                         start_time = start_time.replace('Z', '+00:00')
-                        metadata['timestamp'] = datetime.fromisoformat(start_time)
+                        parsed = datetime.fromisoformat(start_time)
+                        if parsed.tzinfo is not None:
+                            parsed = parsed.astimezone().replace(tzinfo=None)
+                        metadata['timestamp'] = parsed
                     except:
                         # Fall back to file mtime
                         pass
 
-                # Extract messages
+                # Extract messages (head only unless asked for all)
                 messages = data.get('messages', [])
-                metadata['messages'] = messages
+                metadata['message_count'] = len(messages)
+                metadata['messages'] = messages if max_messages is None else messages[:max_messages]
 
                 # Generate summary from first user message
                 if messages:
@@ -318,7 +462,7 @@ class GeminiProvider(AIProvider):
                         content = first_user_msg.get('content', '')
                         metadata['summary'] = content[:100] + ('...' if len(content) > 100 else '')
 
-        except (IOError, json.JSONDecodeError):
+        except (IOError, ValueError):
             pass
 
         return metadata
@@ -330,31 +474,34 @@ class GeminiProvider(AIProvider):
         return ['gemini', '-r', session_id]
 
 
+# One instance per provider for the whole process, so cached lookups are shared
+_PROVIDER_CLASSES = {'claude': ClaudeProvider, 'gemini': GeminiProvider}
+_providers: Dict[str, AIProvider] = {}
+
+
 def get_provider(name: str) -> Optional[AIProvider]:
     """Get provider instance by name"""
-    providers = {
-        'claude': ClaudeProvider(),
-        'gemini': GeminiProvider()
-    }
-    return providers.get(name.lower())
+    name = name.lower()
+    provider = _providers.get(name)
+    if provider is None:
+        provider_class = _PROVIDER_CLASSES.get(name)
+        if provider_class is None:
+            return None
+        provider = _providers[name] = provider_class()
+    return provider
 
 
 def detect_provider() -> Optional[AIProvider]:
     """Auto-detect available provider (prefers Gemini)"""
-    # Try Gemini first (default)
-    gemini = GeminiProvider()
-    if gemini.is_available():
-        return gemini
-
-    # Fall back to Claude
-    claude = ClaudeProvider()
-    if claude.is_available():
-        return claude
-
+    # Try Gemini first (default), then fall back to Claude
+    for name in ('gemini', 'claude'):
+        provider = get_provider(name)
+        if provider.is_available():
+            return provider
     return None
 
 
-def get_all_providers() -> List[AIProvider]:
+def get_all_providers() -> Tuple[AIProvider, ...]:
     """Get all available providers"""
-    providers = [ClaudeProvider(), GeminiProvider()]
-    return [p for p in providers if p.is_available()]
+    providers = (get_provider('claude'), get_provider('gemini'))
+    return tuple(p for p in providers if p.is_available())
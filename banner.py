@@ -10,14 +10,19 @@ TULES_BANNER = r"""
    ╚═╝    ╚═════╝ ╚══════╝╚══════╝╚══════╝
 """
 
+# Full banners, built once at import
+BANNER_TULES = TULES_BANNER + "\n  Background Agent Runner (T)\n"
+BANNER_INSTANT = TULES_BANNER + "\n  Instant AI Responses (Ti)\n"
+BANNER_SESSIONS = TULES_BANNER + "\n  Session Browser (Ts)\n"
+
 def print_banner_tules() -> str:
     """Return banner with 'Background Agent Runner (T)' description."""
-    return TULES_BANNER + "\n  Background Agent Runner (T)\n"
+    return BANNER_TULES
 
 def print_banner_instant() -> str:
     """Return banner with 'Instant AI Responses (Ti)' description."""
-    return TULES_BANNER + "\n  Instant AI Responses (Ti)\n"
+    return BANNER_INSTANT
 
 def print_banner_sessions() -> str:
     """Return banner with 'Session Browser (Ts)' description."""
-    return TULES_BANNER + "\n  Session Browser (Ts)\n"
\ No newline at end of file
+    return BANNER_SESSIONS
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Session metadata index for Tules-sessions
+Caches parsed session files in SQLite so only new or changed files are reparsed
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Optional
+
+INDEX_DIR = Path.home() / '.cache' / 'tules'
+INDEX_DB = INDEX_DIR / 'sessions-index.db'
+
+# Bump when the stored metadata shape changes; stale tables are rebuilt
+SCHEMA_VERSION = 4
+
+
+class SessionIndex:
+    """mtime/size-validated cache of provider.parse_session_header() results"""
+
+    def __init__(self, db_path: Path = INDEX_DB):
+        self.conn = None
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(db_path))
+            self._ensure_schema()
+        except (OSError, sqlite3.Error):
+            # Index is an optimisation only - fall back to parsing every file
+            self.conn = None
+
+    def _ensure_schema(self):
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.conn.execute('DROP TABLE IF EXISTS sessions')
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS sessions ('
+            'path TEXT PRIMARY KEY, mtime REAL, size INTEGER, '
+            'id TEXT, summary TEXT, cwd TEXT, git_branch TEXT, '
+            'timestamp TEXT, is_agent INTEGER, message_count INTEGER)'
+        )
+
+    def lookup(self, path: Path, st: os.stat_result) -> Optional[Dict]:
+        """Return cached metadata if the file is unchanged since it was indexed"""
+        if self.conn is None:
+            return None
+
+        try:
+            row = self.conn.execute(
+                'SELECT mtime, size, id, summary, cwd, git_branch, timestamp, is_agent, message_count '
+                'FROM sessions WHERE path = ?',
+                (str(path),)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None or row[0] != st.st_mtime or row[1] != st.st_size:
+            return None
+
+        return {
+            'id': row[2],
+            'summary': row[3],
+            'cwd': row[4],
+            'git_branch': row[5],
+            'timestamp': datetime.fromisoformat(row[6]),
+            'is_agent': bool(row[7]),
+            'message_count': row[8],
+        }
+
+    def store(self, path: Path, st: os.stat_result, metadata: Dict):
+        """Record freshly parsed metadata for a file"""
+        if self.conn is None:
+            return
+
+        try:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    str(path), st.st_mtime, st.st_size,
+                    metadata['id'], metadata['summary'],
+                    metadata.get('cwd'), metadata.get('git_branch'),
+                    metadata['timestamp'].isoformat(),
+                    int(metadata.get('is_agent', False)),
+                    metadata.get('message_count', 0),
+                )
+            )
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        if self.conn is None:
+            return
+        try:
+            self.conn.commit()
+            self.conn.close()
+        except sqlite3.Error:
+            pass
+        self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -26,7 +26,7 @@ setup(
     url="https://github.com/aymuos15/Tules",
 
     # Include Python modules
-    py_modules=["ai_provider"],
+    py_modules=["ai_provider", "tules_cache", "sessions_index"],
 
     # Include the main scripts
     scripts=[
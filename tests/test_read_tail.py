@@ -0,0 +1,48 @@
+"""read_tail() must match `tail -n`, including logs with CR progress bars"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from Tules import read_tail  # noqa: E402
+
+SAMPLES = [
+    b'',
+    b'\n',
+    b'line1\nline2\nprogress 10%\rprogress 50%\rprogress 100%\nline4\n',
+    b'line1\nline2\nprogress 10%\rprogress 50%\rprogress 100%\nline4',
+    b'a\r\nb\r\nc\r\n',
+    b'\n\n\nlast\n',
+    b'only\rcarriage\rreturns',
+    b''.join(b'row %d\r%d%%\n' % (i, i) for i in range(500)),
+]
+
+
+@unittest.skipUnless(shutil.which('tail'), 'tail not available')
+class ReadTailTest(unittest.TestCase):
+    def test_matches_tail(self):
+        for sample in SAMPLES:
+            with tempfile.NamedTemporaryFile(delete=False) as f:
+                f.write(sample)
+            try:
+                for lines in (1, 2, 3, 10, 600):
+                    # A tiny chunk size exercises the backwards-growing window
+                    for chunk_size in (4, 64 * 1024):
+                        expected = subprocess.run(
+                            ['tail', '-n', str(lines), f.name],
+                            capture_output=True, check=True
+                        ).stdout.decode('utf-8', errors='replace')
+                        with self.subTest(sample=sample[:40], lines=lines, chunk_size=chunk_size):
+                            self.assertEqual(read_tail(Path(f.name), lines, chunk_size), expected)
+            finally:
+                os.unlink(f.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,9 +4,11 @@ import subprocess
 import sys
 import tempfile
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
+from rich.columns import Columns
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.syntax import Syntax
@@ -201,6 +203,59 @@ def render_response(text: str) -> None:
     blocks = split_markdown_and_code(text)
     render_blocks(blocks)
 
+
+class StreamingMarkdown:
+    """
+    Live-updating markdown view for text that arrives in chunks.
+
+    Chunks are only concatenated and parsed when Rich refreshes the live
+    region, so feeding many small chunks stays cheap. On a clean exit the
+    transient preview is replaced by the full `render_response` output.
+    """
+
+    def __init__(self, refresh_per_second: int = 10):
+        self._parts: List[str] = []
+        self._live = Live(
+            self,
+            console=console,
+            refresh_per_second=refresh_per_second,
+            transient=True,
+        )
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> None:
+        self._parts.append(chunk)
+
+    def __rich_console__(self, console, options):
+        yield Markdown(normalize_markdown(self.text), code_theme="monokai")
+
+    def __enter__(self) -> "StreamingMarkdown":
+        self._live.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._live.__exit__(exc_type, exc, tb)
+        if exc_type is None:
+            render_response(self.text.strip())
+
+
+def render_comparison(responses: List[Tuple[str, str]]) -> None:
+    """Render (title, markdown) responses side by side, one column each."""
+    width = max(20, console.width // max(1, len(responses)) - 1)
+    panels = [
+        Panel(
+            Markdown(normalize_markdown(text), code_theme="monokai", hyperlinks=True),
+            title=f"[bold cyan]{title}[/bold cyan]",
+            border_style="cyan",
+            width=width,
+        )
+        for title, text in responses
+    ]
+    console.print(Columns(panels, equal=True))
+
 # ---------------------------------------------------------------------------
 # CLI glue (stdin-only)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Local response cache for Tules-instant
+Stores provider responses in SQLite keyed by (provider, model, workspace, prompt)
+"""
+
+import os
+import time
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path.home() / '.cache' / 'tules'
+CACHE_DB = CACHE_DIR / 'responses.db'
+DEFAULT_TTL = 3600  # 1 hour
+
+
+def _git_dir(directory: Path) -> Optional[Path]:
+    """The git directory for a work tree root, following `gitdir:` files
+
+    Worktrees and submodules have a .git file pointing at their real git dir.
+    """
+    dot_git = directory / '.git'
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        pointer = dot_git.read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    if not pointer.startswith('gitdir:'):
+        return None
+    # Relative pointers are relative to the directory holding the .git file
+    return directory / pointer[len('gitdir:'):].strip()
+
+
+def _workspace_state(cwd: str) -> str:
+    """Cheap marker for the repo state: git HEAD plus index mtime, if any"""
+    path = Path(cwd)
+    for directory in (path, *path.parents):
+        git_dir = _git_dir(directory)
+        if git_dir is None:
+            continue
+        try:
+            head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+        except OSError:
+            continue
+        try:
+            index_mtime = (git_dir / 'index').stat().st_mtime_ns
+        except OSError:
+            index_mtime = 0
+        return f"{head}@{index_mtime}"
+    return ''
+
+
+def make_llm_key(provider: str, model: Optional[str] = None,
+                 cwd: Optional[str] = None) -> str:
+    """Build the provider/model/workspace part of a cache key
+
+    The CLIs answer from the working directory, so a response is only reused
+    from the same directory and repo state.
+    """
+    cwd = cwd or os.getcwd()
+    return f"{provider}|{model or 'default'}|{cwd}|{_workspace_state(cwd)}"
+
+
+def _cache_key(prompt: str, llm_key: str) -> str:
+    """Hash provider/model and prompt into a fixed-size key"""
+    return hashlib.blake2b(f"{llm_key}|{prompt}".encode('utf-8')).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating it on first use"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(CACHE_DB))
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS responses ('
+        'key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)'
+    )
+    return conn
+
+
+def lookup(prompt: str, llm_key: str, ttl: float = DEFAULT_TTL) -> Optional[str]:
+    """Return a cached response, or None on miss/expiry"""
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                'SELECT response, created FROM responses WHERE key = ?',
+                (_cache_key(prompt, llm_key),)
+            ).fetchone()
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        return None
+
+    if row is None or time.time() - row[1] > ttl:
+        return None
+    return row[0]
+
+
+def update(prompt: str, llm_key: str, response: str):
+    """Store a response in the cache"""
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                # Drop expired entries so the file doesn't grow without bound
+                conn.execute('DELETE FROM responses WHERE created < ?',
+                             (time.time() - DEFAULT_TTL,))
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)',
+                    (_cache_key(prompt, llm_key), response, time.time())
+                )
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        pass